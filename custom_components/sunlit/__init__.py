@@ -143,6 +143,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             api_client=api_client,
             family_id=str(family_info["id"]),
             family_name=family_info["name"],
+            family_coordinator=family_coordinator,
         )
         await strategy_coordinator.async_config_entry_first_refresh()
 
@@ -233,5 +234,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         local_manager = entry_data.get("local_manager")
         if local_manager is not None:
             await local_manager.async_stop()
+        api_client = entry_data.get("api_client")
+        if api_client is not None:
+            await api_client.async_close()
 
     return unload_ok
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import functools
 import logging
+import time
 from typing import Any
 
 import aiohttp
+from multidict import CIMultiDict
+import orjson
 
 from .const import (
     API_BASE_URL,
@@ -30,22 +36,79 @@ from .const import (
     API_TARIFF_INDEX,
     API_TARIFF_STRATEGY_ADD,
     API_USER_LOGIN,
+    DEVICE_DETAILS_CACHE_TTL,
+    DEVICE_LIST_CACHE_TTL,
+    GITHUB_URL,
+    INTEGRATION_NAME,
+    MAX_CONCURRENT_API_REQUESTS,
+    VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bytes of an HTTP error body included in SunlitConnectionError messages.
+_ERROR_BODY_PREVIEW_BYTES = 512
+
 
 class SunlitApiError(Exception):
     """Base exception for Sunlit API errors."""
 
+    __slots__ = ()
+
 
 class SunlitAuthError(SunlitApiError):
     """Exception for authentication errors."""
 
+    __slots__ = ()
+
 
 class SunlitConnectionError(SunlitApiError):
     """Exception for connection errors."""
 
+    __slots__ = ()
+
+
+@functools.lru_cache(maxsize=32)
+def _device_list_payload(family_id: int, device_type: str) -> bytes:
+    """Serialize the device-list request body once per (family, type)."""
+    return orjson.dumps({"familyId": family_id, "deviceType": device_type})
+
+
+def _single_flight(
+    method: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Share one in-flight request between concurrent calls with equal arguments.
+
+    Late callers await the pending request instead of issuing a duplicate;
+    the entry is dropped as soon as the request completes. The request keeps
+    running if every caller is cancelled, so its outcome is always retrieved
+    and ``async_close`` cancels whatever is still pending.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: SunlitApiClient, *args: Any, **kwargs: Any) -> Any:
+        key = (
+            method.__name__,
+            *(str(arg) for arg in args),
+            *sorted(kwargs.items()),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._inflight[key] = task
+
+            def _done(done: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                # Mark the error retrieved in case no caller is left to await it
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_done)
+        # Shielded so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    return wrapper
+
 
 def _format_api_message(message: Any) -> str:
     """Render an API error message into a readable string.
@@ -85,26 +148,62 @@ class SunlitApiClient:
         self._session = session
         self._access_token = access_token
         self._timeout = timeout
+        # Applied by aiohttp itself; built once and reused for every request.
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
         self._base_url = API_BASE_URL
         self._ha_version = ha_version or "unknown"
+        self._headers: CIMultiDict[str] | None = None
+        self._headers_token: str | None = None
+        # Shared by every coordinator using this client
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_REQUESTS)
+        # Pending requests shared between concurrent identical calls
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # device_id -> (monotonic fetch time, details content)
+        self._details_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._details_ttl = DEVICE_DETAILS_CACHE_TTL.total_seconds()
+        # (family_id, device_type) -> (monotonic fetch time, device list)
+        self._device_list_cache: dict[
+            tuple[str, str], tuple[float, list[dict[str, Any]]]
+        ] = {}
+        self._device_list_ttl = DEVICE_LIST_CACHE_TTL.total_seconds()
+
+    async def async_close(self) -> None:
+        """Cancel shared requests still in flight.
+
+        The aiohttp session belongs to Home Assistant and stays open.
+        """
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._inflight.clear()
 
-    def _build_headers(self) -> dict[str, str]:
-        """Build request headers with authentication."""
-        from .const import GITHUB_URL, INTEGRATION_NAME, VERSION
+    def _build_headers(self) -> CIMultiDict[str]:
+        """Build request headers with authentication.
+
+        The headers only depend on the token, so they are built once per token
+        as a ``CIMultiDict`` that aiohttp uses without converting it again.
+        """
+        if self._headers is not None and self._headers_token == self._access_token:
+            return self._headers
 
         # Build User-Agent string
         user_agent = f"{INTEGRATION_NAME}/{VERSION} (+{GITHUB_URL})"
         if self._ha_version != "unknown":
             user_agent += f" HomeAssistant/{self._ha_version}"
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": user_agent,
-        }
+        headers = CIMultiDict(
+            {
+                "Content-Type": "application/json",
+                "User-Agent": user_agent,
+            }
+        )
 
         if self._access_token:
             headers["Authorization"] = f"Bearer {self._access_token}"
 
+        self._headers = headers
+        self._headers_token = self._access_token
         return headers
 
     async def _make_request(
@@ -132,41 +231,49 @@ class SunlitApiClient:
         headers = self._build_headers()
 
         try:
-            async with asyncio.timeout(self._timeout):
-                async with self._session.request(
+            async with (
+                self._request_semaphore,
+                self._session.request(
                     method,
                     url,
                     headers=headers,
+                    timeout=self._client_timeout,
                     **kwargs,
-                ) as response:
-                    if response.status == 401:
+                ) as response,
+            ):
+                # Successful responses fall straight through to the body.
+                status = response.status
+                if status >= 400:
+                    if status == 401:
                         raise SunlitAuthError("Invalid authentication token")
+                    # Only the head of the body is useful in the message; avoid
+                    # decoding (and charset-sniffing) large error pages.
+                    raw = await response.content.read(_ERROR_BODY_PREVIEW_BYTES)
+                    text = raw.decode("utf-8", errors="replace")
+                    raise SunlitConnectionError(
+                        f"API request failed with status {status}: {text}"
+                    )
 
-                    if response.status >= 400:
-                        text = await response.text()
-                        raise SunlitConnectionError(
-                            f"API request failed with status {response.status}: {text}"
-                        )
-
-                    data = await response.json()
+                # orjson is a Home Assistant core dependency and parses the
+                # larger list payloads (history, device lists) much faster.
+                data = await response.json(loads=orjson.loads)
 
-                    # Check for API-level errors
-                    if isinstance(data, dict) and data.get("code") != 0:
-                        message = _format_api_message(
-                            data.get("message", "Unknown error")
-                        )
-                        raise SunlitApiError(f"API error: {message}")
+                # Check for API-level errors
+                if isinstance(data, dict) and data.get("code") != 0:
+                    message = _format_api_message(data.get("message", "Unknown error"))
+                    raise SunlitApiError(f"API error: {message}")
 
-                    # Log full response for debugging
-                    _LOGGER.debug("API Response from %s: %s", url, data)
-                    return data
+                # Log full response for debugging
+                _LOGGER.debug("API Response from %s: %s", url, data)
+                return data
 
-        except aiohttp.ClientError as err:
-            raise SunlitConnectionError(f"Connection error: {err}") from err
+        # aiohttp's timeout errors are also ClientErrors; report them as timeouts.
         except TimeoutError as err:
             raise SunlitConnectionError(
                 f"Request timeout after {self._timeout}s"
             ) from err
+        except aiohttp.ClientError as err:
+            raise SunlitConnectionError(f"Connection error: {err}") from err
 
     async def login(self, email: str, password: str) -> dict[str, Any]:
         """Login with email and password to get access token.
@@ -201,11 +308,12 @@ class SunlitApiClient:
                     # Store the token for future requests
                     self._access_token = content["access_token"]
                     _LOGGER.info("Login successful for user: %s", email)
-                    # Log response with masked token for debugging
-                    debug_content = content.copy()
-                    if "access_token" in debug_content:
+                    # Log response with masked token for debugging; the masked
+                    # copy is only built when debug logging is on
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        debug_content = content.copy()
                         debug_content["access_token"] = "***MASKED***"
-                    _LOGGER.debug("Login response for %s: %s", email, debug_content)
+                        _LOGGER.debug("Login response for %s: %s", email, debug_content)
                     return content
 
             _LOGGER.error("Invalid login response structure: %s", response)
@@ -247,6 +355,7 @@ class SunlitApiClient:
             _LOGGER.error("Failed to fetch families: %s", err)
             raise
 
+    @_single_flight
     async def fetch_device_statistics(self, device_id: str | int) -> dict[str, Any]:
         """Fetch detailed statistics for a specific device.
 
@@ -373,16 +482,32 @@ class SunlitApiClient:
             SunlitConnectionError: Connection failed
             SunlitApiError: API returned an error
         """
-        from datetime import datetime
-
         now = datetime.now()
         return await self.fetch_battery_io_power(
             device_id, now.year, now.month, now.day
         )
 
+    def invalidate_device(self, device_id: str | int | None = None) -> None:
+        """Drop cached device details so the next fetch hits the API.
+
+        Args:
+            device_id: Device whose details to drop; ``None`` clears all,
+                including the cached device lists
+        """
+        if device_id is None:
+            self._details_cache.clear()
+            self._device_list_cache.clear()
+        else:
+            self._details_cache.pop(str(device_id), None)
+
+    @_single_flight
     async def fetch_device_details(self, device_id: str | int) -> dict[str, Any]:
         """Fetch detailed information for a specific device.
 
+        Details are cached per device for ``DEVICE_DETAILS_CACHE_TTL`` (not
+        while an OTA update is in progress); use ``invalidate_device`` to
+        force a refetch. Callers always receive their own copy.
+
         Args:
             device_id: The device ID to fetch details for
 
@@ -402,7 +527,12 @@ class SunlitApiClient:
             SunlitConnectionError: Connection failed
             SunlitApiError: API returned an error
         """
-        endpoint = API_DEVICE_DETAILS.replace("{device_id}", str(device_id))
+        cache_key = str(device_id)
+        cached = self._details_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._details_ttl:
+            return dict(cached[1])
+
+        endpoint = API_DEVICE_DETAILS.replace("{device_id}", cache_key)
 
         try:
             # This is a GET endpoint - no JSON payload
@@ -417,20 +547,30 @@ class SunlitApiClient:
                     data.get("deviceType", "Unknown"),
                     data.get("status", "Unknown"),
                 )
-                return data
+            else:
+                # If no content wrapper, return raw response
+                data = response
 
-            # If no content wrapper, return raw response
-            return response
+            # Firmware is about to change while an OTA update runs; refetch
+            # until it has finished instead of caching the old version.
+            if not data.get("otaInProgress"):
+                self._details_cache[cache_key] = (time.monotonic(), dict(data))
+            return data
 
         except SunlitApiError as err:
             _LOGGER.error("Failed to fetch details for device %s: %s", device_id, err)
             raise
 
+    @_single_flight
     async def fetch_device_list(
         self, family_id: str | int, device_type: str = "ALL"
     ) -> list[dict[str, Any]]:
         """Fetch list of devices for a specific family.
 
+        The list is cached per family and device type for
+        ``DEVICE_LIST_CACHE_TTL`` so the device and family coordinators share
+        one request per poll. Callers must treat the result as read-only.
+
         Args:
             family_id: The family ID to fetch devices for
             device_type: Type of devices to fetch (default: "ALL")
@@ -454,10 +594,16 @@ class SunlitApiClient:
             SunlitConnectionError: Connection failed
             SunlitApiError: API returned an error
         """
+        cache_key = (str(family_id), device_type)
+        cached = self._device_list_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._device_list_ttl:
+            return [dict(device) for device in cached[1]]
+
         try:
-            payload = {"familyId": int(family_id), "deviceType": device_type}
+            # Polled every cycle with the same body; send pre-serialized bytes.
+            payload = _device_list_payload(int(family_id), device_type)
 
-            response = await self._make_request("POST", API_DEVICE_LIST, json=payload)
+            response = await self._make_request("POST", API_DEVICE_LIST, data=payload)
 
             # Extract device list from paginated response structure
             # Format: { content: { content: [...devices...], pageable: {...} } }
@@ -479,10 +625,15 @@ class SunlitApiClient:
                         paginated_data.get("number", 0) + 1,
                         paginated_data.get("totalPages", 1),
                     )
+                    self._device_list_cache[cache_key] = (
+                        time.monotonic(),
+                        [dict(device) for device in devices],
+                    )
                     return devices
 
             # Return empty list if no devices found
             _LOGGER.debug("No devices found for family %s", family_id)
+            self._device_list_cache[cache_key] = (time.monotonic(), [])
             return []
 
         except SunlitApiError as err:
@@ -491,6 +642,7 @@ class SunlitApiClient:
             )
             raise
 
+    @_single_flight
     async def fetch_space_soc(self, space_id: str | int) -> dict[str, Any]:
         """Fetch battery SOC limits configuration for a space/family.
 
@@ -689,9 +841,14 @@ class SunlitApiClient:
         """
         payload = {"enable": enable, "deviceSn": device_sn}
         _LOGGER.debug("Setting battery %s local mode to %s", device_sn, enable)
-        return await self._make_request(
+        response = await self._make_request(
             "POST", API_BATTERY_LOCAL_MODE_CONFIG, json=payload
         )
+        # localModeEnabled is read from device details; drop the stale copy.
+        for cache_key, (_, details) in list(self._details_cache.items()):
+            if (details or {}).get("deviceSn") == device_sn:
+                del self._details_cache[cache_key]
+        return response
 
     async def set_tariff_strategy(
         self,
@@ -934,6 +1091,7 @@ class SunlitApiClient:
             )
             raise
 
+    @_single_flight
     async def fetch_space_current_strategy(
         self, family_id: str | int
     ) -> dict[str, Any]:
@@ -1055,6 +1213,7 @@ class SunlitApiClient:
             )
             raise
 
+    @_single_flight
     async def fetch_space_index(self, space_id: str | int) -> dict[str, Any]:
         """Fetch comprehensive dashboard data for a space.
 
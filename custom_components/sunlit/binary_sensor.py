@@ -1,18 +1,30 @@
-"""Platform for binary sensor integration."""
+"""Platform for binary sensor integration.
+
+The family and device coordinators run with ``always_update=False``, so
+these entities are only written when a poll returns different data. That
+relies on ``is_on``/``available`` reading solely from ``coordinator.data``.
+"""
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from functools import partial
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
+    BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
+from .coordinators import SunlitDeviceCoordinator, SunlitFamilyCoordinator
 from .entities.device_binary_sensor import SunlitDeviceBinarySensor
 from .entities.family_binary_sensor import SunlitFamilyBinarySensor
 
@@ -146,6 +158,144 @@ DEVICE_BINARY_SENSORS = {
 }
 
 
+def _build_descriptions(
+    sensors: dict[str, dict],
+) -> dict[str, BinarySensorEntityDescription]:
+    """Build one shared entity description per sensor key."""
+    return {
+        key: BinarySensorEntityDescription(
+            key=key,
+            name=config["name"],
+            device_class=config.get("device_class"),
+        )
+        for key, config in sensors.items()
+    }
+
+
+# Descriptions are static, so build them once at import and share them
+# between every family/device entity instead of per setup.
+FAMILY_BINARY_SENSOR_DESCRIPTIONS = _build_descriptions(FAMILY_BINARY_SENSORS)
+DEVICE_BINARY_SENSOR_DESCRIPTIONS = _build_descriptions(DEVICE_BINARY_SENSORS)
+
+# Flat (description, icon[, inverted]) rows per key so the setup loops only
+# unpack tuples instead of probing the config dicts per entity. Rows keep the
+# definition order, which is also the order entities are created in.
+_FAMILY_ROWS = {
+    key: (FAMILY_BINARY_SENSOR_DESCRIPTIONS[key], config.get("icon"))
+    for key, config in FAMILY_BINARY_SENSORS.items()
+}
+_DEVICE_ROWS = {
+    key: (
+        DEVICE_BINARY_SENSOR_DESCRIPTIONS[key],
+        config.get("icon"),
+        config.get("inverted", False),
+    )
+    for key, config in DEVICE_BINARY_SENSORS.items()
+}
+_FAMILY_KEYS = frozenset(_FAMILY_ROWS)
+_DEVICE_KEYS = frozenset(_DEVICE_ROWS)
+_FAMILY_ORDER = {key: index for index, key in enumerate(_FAMILY_ROWS)}
+_DEVICE_ORDER = {key: index for index, key in enumerate(_DEVICE_ROWS)}
+
+
+def _present_keys(
+    keys: frozenset[str], order: dict[str, int], data: dict[str, Any]
+) -> list[str]:
+    """Return the defined keys present in data, in definition order."""
+    return sorted(keys.intersection(data), key=order.__getitem__)
+
+
+def _build_family_sensors(
+    family_coordinator: SunlitFamilyCoordinator, entry_id: str, known: set[str]
+) -> list[SunlitFamilyBinarySensor]:
+    """Create the family binary sensors present in the data and not in known.
+
+    Created keys are added to ``known``.
+    """
+    family_data = family_coordinator.data["family"]
+    fam_id = family_coordinator.family_id
+    fam_name = family_coordinator.family_name
+    sensors = []
+    for key in _present_keys(_FAMILY_KEYS, _FAMILY_ORDER, family_data):
+        if key in known:
+            continue
+        known.add(key)
+        description, icon = _FAMILY_ROWS[key]
+        sensors.append(
+            SunlitFamilyBinarySensor(
+                coordinator=family_coordinator,
+                description=description,
+                entry_id=entry_id,
+                family_id=fam_id,
+                family_name=fam_name,
+                icon=icon,
+            )
+        )
+    return sensors
+
+
+def _build_device_sensors(
+    device_coordinator: SunlitDeviceCoordinator,
+    entry_id: str,
+    known: set[tuple[str, str]],
+) -> list[SunlitDeviceBinarySensor]:
+    """Create the device binary sensors present in the data and not in known.
+
+    Created ``(device_id, key)`` pairs are added to ``known``.
+    """
+    sensors = []
+    # Bind per-coordinator attributes once, outside the device loop
+    devices_map = device_coordinator.devices or {}
+    fam_id = device_coordinator.family_id
+    fam_name = device_coordinator.family_name
+    for device_id, device_data in device_coordinator.data["devices"].items():
+        device_info = devices_map.get(device_id)
+        if device_info is None:
+            continue
+
+        for key in _present_keys(_DEVICE_KEYS, _DEVICE_ORDER, device_data):
+            if (device_id, key) in known:
+                continue
+            known.add((device_id, key))
+            description, icon, inverted = _DEVICE_ROWS[key]
+            sensor = SunlitDeviceBinarySensor(
+                coordinator=device_coordinator,
+                description=description,
+                entry_id=entry_id,
+                family_id=fam_id,
+                family_name=fam_name,
+                device_id=device_id,
+                device_info_data=device_info,
+                icon=icon,
+                inverted=inverted,
+            )
+            sensors.append(sensor)
+    return sensors
+
+
+def _add_new_on_update(
+    config_entry: ConfigEntry,
+    coordinator: DataUpdateCoordinator,
+    data_key: str,
+    build: Callable[[], list[BinarySensorEntity]],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add entities for data that shows up after setup.
+
+    ``build`` only returns entities that were not created before, so devices
+    and keys appearing on a later refresh are added instead of dropped.
+    """
+
+    @callback
+    def _add_new_entities() -> None:
+        if not coordinator.data or data_key not in coordinator.data:
+            return
+        if entities := build():
+            async_add_entities(entities, True)
+
+    config_entry.async_on_unload(coordinator.async_add_listener(_add_new_entities))
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -161,7 +311,7 @@ async def async_setup_entry(
         # Fallback for old structure
         coordinators = integration_data
 
-    sensors = []
+    entry_id = config_entry.entry_id
 
     # Process multiple family coordinators
     for family_id, coordinator_set in coordinators.items():
@@ -181,52 +331,35 @@ async def async_setup_entry(
             _LOGGER.warning("Missing essential coordinators for family %s", family_id)
             continue
 
+        sensors = []
+        build_family = partial(
+            _build_family_sensors, family_coordinator, entry_id, set()
+        )
+        build_devices = partial(
+            _build_device_sensors, device_coordinator, entry_id, set()
+        )
+
         # Create family binary sensors
         if family_coordinator.data and "family" in family_coordinator.data:
-            for key, config in FAMILY_BINARY_SENSORS.items():
-                if key in family_coordinator.data["family"]:
-                    sensor_description = BinarySensorEntityDescription(
-                        key=key,
-                        name=config["name"],
-                        device_class=config.get("device_class"),
-                    )
-                    sensor = SunlitFamilyBinarySensor(
-                        coordinator=family_coordinator,
-                        description=sensor_description,
-                        entry_id=config_entry.entry_id,
-                        family_id=family_coordinator.family_id,
-                        family_name=family_coordinator.family_name,
-                        icon=config.get("icon"),
-                    )
-                    sensors.append(sensor)
+            sensors.extend(build_family())
 
         # Create device binary sensors
         if device_coordinator.data and "devices" in device_coordinator.data:
-            for device_id, device_data in device_coordinator.data["devices"].items():
-                if (
-                    device_coordinator.devices
-                    and device_id in device_coordinator.devices
-                ):
-                    device_info = device_coordinator.devices[device_id]
-
-                    for key, config in DEVICE_BINARY_SENSORS.items():
-                        if key in device_data:
-                            sensor_description = BinarySensorEntityDescription(
-                                key=key,
-                                name=config["name"],
-                                device_class=config.get("device_class"),
-                            )
-                            sensor = SunlitDeviceBinarySensor(
-                                coordinator=device_coordinator,
-                                description=sensor_description,
-                                entry_id=config_entry.entry_id,
-                                family_id=device_coordinator.family_id,
-                                family_name=device_coordinator.family_name,
-                                device_id=device_id,
-                                device_info_data=device_info,
-                                icon=config.get("icon"),
-                                inverted=config.get("inverted", False),
-                            )
-                            sensors.append(sensor)
-
-    async_add_entities(sensors, True)
+            sensors.extend(build_devices())
+
+        # Pick up keys and devices that appear on later refreshes
+        _add_new_on_update(
+            config_entry, family_coordinator, "family", build_family, async_add_entities
+        )
+        _add_new_on_update(
+            config_entry,
+            device_coordinator,
+            "devices",
+            build_devices,
+            async_add_entities,
+        )
+
+        # Add each family's entities as soon as they are built and yield to
+        # the event loop so large installs don't stall startup.
+        async_add_entities(sensors, True)
+        await asyncio.sleep(0)
@@ -34,6 +34,7 @@ from .coordinators.tariff_calendar import (
     HourlyPrice,
     SunlitTariffCalendarCoordinator,
 )
+from .entities.base import family_slug
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -194,16 +195,13 @@ class SunlitTariffCalendar(
         self._tag_set = tag_set
         self._kind = kind
         self._summary_label = summary_label
-        slug_family = family_name.lower().replace(" ", "_")
+        slug_family = family_slug(family_name)
         self._attr_unique_id = f"sunlit_{slug_family}_{family_id}_{key}"
         self._attr_name = name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Attach the calendar to the family hub device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"family_{self._family_id}")},
-            name=f"{self._family_name} Solar System",
+        # Attach the calendar to the family hub device
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"family_{family_id}")},
+            name=f"{family_name} Solar System",
             manufacturer="Sunlit Solar",
             model="Solar Management Hub",
         )
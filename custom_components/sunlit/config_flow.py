@@ -50,6 +50,64 @@ from .local.protocol import DEFAULT_PORT as LOCAL_TCP_PORT
 _LOGGER = logging.getLogger(__name__)
 
 
+def _percent_selector(minimum: int, maximum: int) -> NumberSelector:
+    """Return a 1%-step slider for an SOC threshold option."""
+    return NumberSelector(
+        NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=1,
+            mode=NumberSelectorMode.SLIDER,
+            unit_of_measurement="%",
+        )
+    )
+
+
+# Form schemas are static, so they are built once at import time
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EMAIL): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            OPT_ENABLE_SOC_EVENTS, default=DEFAULT_ENABLE_SOC_EVENTS
+        ): BooleanSelector(),
+        vol.Optional(
+            OPT_SOC_THRESHOLD_CRITICAL_LOW,
+            default=DEFAULT_SOC_THRESHOLD_CRITICAL_LOW,
+        ): _percent_selector(1, 50),
+        vol.Optional(
+            OPT_SOC_THRESHOLD_LOW, default=DEFAULT_SOC_THRESHOLD_LOW
+        ): _percent_selector(5, 60),
+        vol.Optional(
+            OPT_SOC_THRESHOLD_HIGH, default=DEFAULT_SOC_THRESHOLD_HIGH
+        ): _percent_selector(60, 95),
+        vol.Optional(
+            OPT_SOC_THRESHOLD_CRITICAL_HIGH,
+            default=DEFAULT_SOC_THRESHOLD_CRITICAL_HIGH,
+        ): _percent_selector(80, 100),
+        vol.Optional(
+            OPT_SOC_CHANGE_THRESHOLD, default=DEFAULT_SOC_CHANGE_THRESHOLD
+        ): _percent_selector(1, 50),
+        vol.Optional(
+            OPT_MIN_EVENT_INTERVAL, default=DEFAULT_MIN_EVENT_INTERVAL
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=10,
+                mode=NumberSelectorMode.BOX,
+                unit_of_measurement="seconds",
+            )
+        ),
+    }
+)
+
+
 def _parse_battery_discovery(
     discovery_info: ZeroconfServiceInfo,
 ) -> dict[str, Any] | None:
@@ -103,7 +161,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.access_token: str | None = None
         self.families: dict[str, Any] = {}
         self.available_families: list[dict[str, Any]] = []
+        # available_families keyed by str(id), the form's option value
+        self._families_by_id: dict[str, dict[str, Any]] = {}
+        # Selection form for the fetched families, built on first render
+        self._families_schema: vol.Schema | None = None
         self._discovered_battery: dict[str, Any] | None = None
+        # Shared across resubmits of the user step; login swaps its token
+        self._client: SunlitApiClient | None = None
 
     async def async_step_zeroconf(
         self, discovery_info: ZeroconfServiceInfo
@@ -197,55 +261,65 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.email = user_input[CONF_EMAIL]
             password = user_input[CONF_PASSWORD]
 
-            try:
-                # Login and fetch families
-                session = async_get_clientsession(self.hass)
-                client = SunlitApiClient(session)
-
-                # Login to get access token
-                login_response = await client.login(self.email, password)
-                self.access_token = login_response.get("access_token")
-
-                if not self.access_token:
-                    errors["base"] = "invalid_auth"
-                else:
-                    # Fetch families with the authenticated client
-                    self.available_families = await client.fetch_families()
-
-                    if not self.available_families:
-                        errors["base"] = "no_families"
-                    else:
-                        # Create unique ID based on email hash
-                        await self.async_set_unique_id(
-                            hashlib.md5(self.email.encode()).hexdigest()[:8]
-                        )
-                        self._abort_if_unique_id_configured()
-
-                        # Move to family selection
-                        return await self.async_step_select_families()
-
-            except SunlitConnectionError:
-                errors["base"] = "cannot_connect"
-            except SunlitAuthError:
-                errors["base"] = "invalid_auth"
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_EMAIL): str,
-                vol.Required(CONF_PASSWORD): str,
-            }
-        )
+            # Create unique ID based on email hash; checked before logging in
+            # so an already configured account aborts without network calls
+            await self.async_set_unique_id(
+                hashlib.md5(self.email.encode(), usedforsecurity=False).hexdigest()[:8]
+            )
+            self._abort_if_unique_id_configured()
+
+            token, families, error = await self._authenticate(self.email, password)
+            if error is not None:
+                errors["base"] = error
+            elif not families:
+                errors["base"] = "no_families"
+            else:
+                self.access_token = token
+                self.available_families = families
+                self._families_by_id = {
+                    str(family["id"]): family for family in families
+                }
+                self._families_schema = None
+
+                # Move to family selection
+                return await self.async_step_select_families()
 
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=USER_SCHEMA,
             errors=errors,
             description_placeholders={"api_url": API_BASE_URL},
         )
 
+    async def _authenticate(
+        self, email: str, password: str
+    ) -> tuple[str | None, list[dict[str, Any]], str | None]:
+        """Log in and fetch the account's families.
+
+        Returns ``(access_token, families, error)`` where ``error`` is the
+        form error key, or ``None`` on success.
+        """
+        if self._client is None:
+            self._client = SunlitApiClient(async_get_clientsession(self.hass))
+        client = self._client
+        try:
+            # Login to get access token
+            login_response = await client.login(email, password)
+            access_token = login_response.get("access_token")
+            if not access_token:
+                return None, [], "invalid_auth"
+
+            # Fetch families with the authenticated client
+            families = await client.fetch_families()
+        except SunlitConnectionError:
+            return None, [], "cannot_connect"
+        except SunlitAuthError:
+            return None, [], "invalid_auth"
+        except Exception:
+            _LOGGER.exception("Unexpected exception")
+            return None, [], "unknown"
+        return access_token, families, None
+
     async def async_step_select_families(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -259,17 +333,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "no_selection"
             else:
                 # Build families dictionary with selected families
+                # and collect the names for the entry title in the same pass
                 self.families = {}
+                family_names = []
                 for family_id in selected_family_ids:
-                    # Find family details from available families
-                    family_data = next(
-                        (
-                            f
-                            for f in self.available_families
-                            if str(f["id"]) == family_id
-                        ),
-                        None,
-                    )
+                    family_data = self._families_by_id.get(family_id)
                     if family_data:
                         self.families[family_id] = {
                             "id": family_data["id"],
@@ -277,9 +345,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             "address": family_data.get("address", ""),
                             "device_count": family_data.get("deviceCount", 0),
                         }
+                        family_names.append(family_data["name"])
 
                 # Create config entry with selected families
-                family_names = [f["name"] for f in self.families.values()]
                 title = f"Sunlit ({', '.join(family_names)})"
 
                 # Stamp any zeroconf-discovered battery onto the new entry so
@@ -302,23 +370,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     options=DEFAULT_OPTIONS,
                 )
 
-        # Create options for family selection
-        family_options = {
-            str(family["id"]): (
-                f"{family['name']} - {family.get('address', 'Unknown')} "
-                f"({family.get('deviceCount', 0)} devices)"
-            )
-            for family in self.available_families
-        }
-
-        schema = vol.Schema(
-            {
-                vol.Required("families"): cv.multi_select(family_options),
+        if self._families_schema is None:
+            # Create options for family selection
+            family_options = {
+                family_id: (
+                    f"{family['name']} - {family.get('address', 'Unknown')} "
+                    f"({family.get('deviceCount', 0)} devices)"
+                )
+                for family_id, family in self._families_by_id.items()
             }
-        )
+            self._families_schema = vol.Schema(
+                {
+                    vol.Required("families"): cv.multi_select(family_options),
+                }
+            )
 
         return self.async_show_form(
-            step_id="select_families", data_schema=schema, errors=errors
+            step_id="select_families",
+            data_schema=self._families_schema,
+            errors=errors,
         )
 
 
@@ -332,102 +402,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        # Build the options schema with current values as defaults
-        options_schema = vol.Schema(
-            {
-                vol.Optional(
-                    OPT_ENABLE_SOC_EVENTS,
-                    default=self.config_entry.options.get(
-                        OPT_ENABLE_SOC_EVENTS, DEFAULT_ENABLE_SOC_EVENTS
-                    ),
-                ): BooleanSelector(),
-                vol.Optional(
-                    OPT_SOC_THRESHOLD_CRITICAL_LOW,
-                    default=self.config_entry.options.get(
-                        OPT_SOC_THRESHOLD_CRITICAL_LOW,
-                        DEFAULT_SOC_THRESHOLD_CRITICAL_LOW,
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=50,
-                        step=1,
-                        mode=NumberSelectorMode.SLIDER,
-                        unit_of_measurement="%",
-                    )
-                ),
-                vol.Optional(
-                    OPT_SOC_THRESHOLD_LOW,
-                    default=self.config_entry.options.get(
-                        OPT_SOC_THRESHOLD_LOW, DEFAULT_SOC_THRESHOLD_LOW
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=5,
-                        max=60,
-                        step=1,
-                        mode=NumberSelectorMode.SLIDER,
-                        unit_of_measurement="%",
-                    )
-                ),
-                vol.Optional(
-                    OPT_SOC_THRESHOLD_HIGH,
-                    default=self.config_entry.options.get(
-                        OPT_SOC_THRESHOLD_HIGH, DEFAULT_SOC_THRESHOLD_HIGH
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=60,
-                        max=95,
-                        step=1,
-                        mode=NumberSelectorMode.SLIDER,
-                        unit_of_measurement="%",
-                    )
-                ),
-                vol.Optional(
-                    OPT_SOC_THRESHOLD_CRITICAL_HIGH,
-                    default=self.config_entry.options.get(
-                        OPT_SOC_THRESHOLD_CRITICAL_HIGH,
-                        DEFAULT_SOC_THRESHOLD_CRITICAL_HIGH,
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=80,
-                        max=100,
-                        step=1,
-                        mode=NumberSelectorMode.SLIDER,
-                        unit_of_measurement="%",
-                    )
-                ),
-                vol.Optional(
-                    OPT_SOC_CHANGE_THRESHOLD,
-                    default=self.config_entry.options.get(
-                        OPT_SOC_CHANGE_THRESHOLD, DEFAULT_SOC_CHANGE_THRESHOLD
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=50,
-                        step=1,
-                        mode=NumberSelectorMode.SLIDER,
-                        unit_of_measurement="%",
-                    )
-                ),
-                vol.Optional(
-                    OPT_MIN_EVENT_INTERVAL,
-                    default=self.config_entry.options.get(
-                        OPT_MIN_EVENT_INTERVAL, DEFAULT_MIN_EVENT_INTERVAL
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=0,
-                        max=3600,
-                        step=10,
-                        mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-            }
+        # Pre-fill the cached schema with the entry's current values
+        options_schema = self.add_suggested_values_to_schema(
+            OPTIONS_SCHEMA, {**DEFAULT_OPTIONS, **self.config_entry.options}
         )
 
         return self.async_show_form(
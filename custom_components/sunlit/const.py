@@ -11,6 +11,9 @@ VERSION = "1.12.1"  # x-release-please-version
 
 DEFAULT_NAME = "Sunlit REST Sensor"
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
+# SOC limits and the charging-box strategy only change when the user edits
+# them, so the family coordinator refreshes them on this slower cadence.
+FAMILY_SETTINGS_REFRESH_INTERVAL = timedelta(minutes=5)
 
 # Nominal capacity of one battery unit (BK215 head unit and each B215 module)
 BATTERY_MODULE_CAPACITY_KWH = 2.15
@@ -41,6 +44,19 @@ API_STRATEGY_SETTING_DETAIL = "/v1.8/strategy/setting/detail"
 API_SPACE_STATISTICS_DYNAMIC_ENERGY = "/v1.1/space/statistics/dynamic/energy"
 API_NOTIFICATION_LIST = "/v1.5/notification/list"
 
+# Device details (serial, firmware, local-mode flags, diagnostics) change far
+# less often than the 30 s poll. The client caches them per device for this
+# long; writes through the client (e.g. local mode) invalidate early.
+DEVICE_DETAILS_CACHE_TTL = timedelta(minutes=5)
+
+# The device and family coordinators both read the family's device list every
+# poll. Keep it just under the scan interval so one API call serves both.
+DEVICE_LIST_CACHE_TTL = timedelta(seconds=25)
+
+# Upper bound on in-flight requests per API client. Coordinators gather their
+# requests freely; the client queues anything beyond this.
+MAX_CONCURRENT_API_REQUESTS = 10
+
 # Configuration keys
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
@@ -2,22 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from ..api_client import SunlitApiClient
-from ..const import BATTERY_MODULE_CAPACITY_KWH, DEFAULT_SCAN_INTERVAL
-from ..event_manager import SunlitEventManager
+from ..const import (
+    BATTERY_MODULE_CAPACITY_KWH,
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_TYPE_BATTERY,
+    DEVICE_TYPE_INVERTER,
+    DEVICE_TYPE_INVERTER_SOLAR,
+    DEVICE_TYPE_METER,
+    DEVICE_TYPE_METER_PRO,
+)
+
+if TYPE_CHECKING:
+    # Only used in annotations; both are passed in by the integration setup
+    from ..api_client import SunlitApiClient
+    from ..event_manager import SunlitEventManager
 
 _LOGGER = logging.getLogger(__name__)
 
 # The Sunlit API exposes up to 7 battery module slots (battery1..battery7).
 MAX_BATTERY_MODULE_SLOTS = 7
 
+# Battery statistics copied verbatim into the device data every poll.
+_SYSTEM_STAT_FIELDS = (
+    "batterySoc",
+    "chargeRemaining",
+    "dischargeRemaining",
+    "batteryMppt1InVol",
+    "batteryMppt1InCur",
+    "batteryMppt1InPower",
+    "batteryMppt2InVol",
+    "batteryMppt2InCur",
+    "batteryMppt2InPower",
+)
+_MODULE_SUFFIXES = ("Soc", "Mppt1InVol", "Mppt1InCur", "Mppt1InPower")
+_MODULE_MODEL_KEYS = tuple(
+    f"battery{n}DeviceModel" for n in range(1, MAX_BATTERY_MODULE_SLOTS + 1)
+)
+
+
+@lru_cache(maxsize=MAX_BATTERY_MODULE_SLOTS + 1)
+def _module_stat_fields(module_count: int) -> tuple[str, ...]:
+    """Return the per-module statistics keys for ``module_count`` modules."""
+    return tuple(
+        f"battery{n}{suffix}"
+        for n in range(1, module_count + 1)
+        for suffix in _MODULE_SUFFIXES
+    )
+
 
 class SunlitDeviceCoordinator(DataUpdateCoordinator):
     """Coordinator for device-level data."""
@@ -35,13 +75,33 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
         self.family_id = family_id
         self.family_name = family_name
         self.devices = {}  # Store device info for registry
+        # (device_id, deviceType) per device of the last list, to detect
+        # membership changes
+        self._devices_signature: tuple[tuple[str, Any], ...] = ()
+        # Bumped on every refresh so dependents can cache derived values
+        self.data_version = 0
         self.event_manager = event_manager
+        # Family coordinator holding the SOC limits, resolved lazily from
+        # hass.data, and the limits read from it once per refresh
+        self._family_coordinator: DataUpdateCoordinator | None = None
+        self._soc_limits: dict[str, float] | None = None
+        # Device type -> processor filling in that device's data
+        self._device_handlers = {
+            DEVICE_TYPE_METER: self._process_meter_device,
+            DEVICE_TYPE_METER_PRO: self._process_meter_device,
+            DEVICE_TYPE_INVERTER: self._process_inverter_device,
+            DEVICE_TYPE_INVERTER_SOLAR: self._process_inverter_device,
+            DEVICE_TYPE_BATTERY: self._process_battery_device,
+        }
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"Sunlit Devices {family_name}",
             update_interval=DEFAULT_SCAN_INTERVAL,  # 30 seconds
+            # Each refresh builds a fresh dict, so unchanged polls can skip
+            # the listener callbacks
+            always_update=False,
         )
 
     def _is_midnight_window(self) -> bool:
@@ -94,86 +154,96 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
                 "Received %d devices for family %s", len(devices), self.family_name
             )
 
-            # Store device information for device registry
-            self.devices = {str(device["deviceId"]): device for device in devices}
+            # Store device information for device registry, keyed by the
+            # canonical string ID used everywhere downstream
+            self._update_devices(devices)
 
-            # Process device data
-            device_data = {}
+            # SOC limits are the same for every battery in this family
+            if self.event_manager:
+                self._soc_limits = self._get_soc_limits()
 
-            # Aggregates for family-level metrics
-            total_grid_export = 0
-            daily_grid_export = 0
-            # Total solar power is the sum of all solar inputs:
-            # - Inverter power (panels connected to inverters)
-            # - Battery MPPT power (panels connected directly to battery)
-            # - Battery module MPPT power (panels on extension modules)
-            total_solar_power = 0
-            total_solar_energy = 0
+            # Process device data. Each device's statistics/details requests
+            # are issued concurrently; the _process_* helpers fill in `data`.
+            device_data = {}
+            tasks = []
 
-            for device in devices:
-                device_id = str(device["deviceId"])
+            for device_id, device in self.devices.items():
                 data = {}
 
                 # Common attributes
                 data["status"] = device.get("status", "Unknown")
                 data["fault"] = device.get("fault", False)
                 data["off"] = device.get("off", False)
-                data["deviceType"] = device.get("deviceType")
-
-                device_type = device.get("deviceType")
-
-                if device_type in ["SHELLY_3EM_METER", "SHELLY_PRO3EM_METER"]:
-                    await self._process_meter_device(device, device_id, data)
-                    # Update aggregates
-                    if device.get("totalRetEnergy") is not None:
-                        total_grid_export += device["totalRetEnergy"]
-                    if device.get("dailyRetEnergy") is not None:
-                        daily_grid_export += device["dailyRetEnergy"]
-
-                elif device_type in ["YUNENG_MICRO_INVERTER", "SOLAR_MICRO_INVERTER"]:
-                    await self._process_inverter_device(device, device_id, data)
-                    # Update aggregates
-                    # Don't add inverter power to total_solar_power!
-                    # Inverters convert DC->AC from battery (OUTPUT), not solar generation (INPUT)
-                    # Only track energy for historical data
-                    if data.get("total_power_generation") is not None:
-                        total_solar_energy += data["total_power_generation"]
-
-                elif device_type == "ENERGY_STORAGE_BATTERY":
-                    await self._process_battery_device(device, device_id, data)
-                    # Update aggregates with battery MPPT solar input
-                    # Battery MPPT1 and MPPT2 inputs represent solar power going into the battery
-                    if data.get("batteryMppt1InPower") is not None:
-                        total_solar_power += data["batteryMppt1InPower"]
-                    if data.get("batteryMppt2InPower") is not None:
-                        total_solar_power += data["batteryMppt2InPower"]
-
-                    # Add solar power from battery extension modules
-                    module_count = data.get("module_count", 1)
-                    for module_num in range(1, module_count + 1):
-                        mppt_key = f"battery{module_num}Mppt1InPower"
-                        if data.get(mppt_key) is not None:
-                            total_solar_power += data[mppt_key]
+                data["deviceType"] = device_type = device.get("deviceType")
+
+                handler = self._device_handlers.get(device_type)
+                if handler is not None:
+                    tasks.append(handler(device, device_id, data))
 
                 device_data[device_id] = data
 
+            await asyncio.gather(*tasks)
+
+            # Aggregates for family-level metrics
+            total_grid_export = 0.0
+            daily_grid_export = 0.0
+            # Total solar power is the sum of all solar inputs:
+            # - Inverter power (panels connected to inverters)
+            # - Battery MPPT power (panels connected directly to battery)
+            # - Battery module MPPT power (panels on extension modules)
+            total_solar_power = 0.0
+            total_solar_energy = 0.0
+
+            # Sum from the processed per-device data so aggregates use the
+            # same (statistics-refreshed, validated) values as the sensors.
+            # Each field only exists on its own device type, so no type
+            # dispatch is needed here.
+            for data in device_data.values():
+                # Meters: statistics values win over the device-list ones
+                ret_energy = data.get("totalretenergy")
+                if ret_energy is None:
+                    ret_energy = data.get("total_ret_energy")
+                if ret_energy is not None:
+                    total_grid_export += ret_energy
+                daily_ret_energy = data.get("dailyretenergy")
+                if daily_ret_energy is None:
+                    daily_ret_energy = data.get("daily_ret_energy")
+                if daily_ret_energy is not None:
+                    daily_grid_export += daily_ret_energy
+
+                # Inverters: don't add inverter power to total_solar_power!
+                # Inverters convert DC->AC from battery (OUTPUT), not solar
+                # generation (INPUT). Only track energy for historical data
+                if data.get("total_power_generation") is not None:
+                    total_solar_energy += data["total_power_generation"]
+
+                # Batteries: MPPT1 and MPPT2 inputs represent solar power going
+                # into the battery, plus one MPPT per extension module
+                if data.get("batteryMppt1InPower") is not None:
+                    total_solar_power += data["batteryMppt1InPower"]
+                if data.get("batteryMppt2InPower") is not None:
+                    total_solar_power += data["batteryMppt2InPower"]
+                for module_num in range(1, data.get("module_count", 0) + 1):
+                    mppt_key = f"battery{module_num}Mppt1InPower"
+                    if data.get(mppt_key) is not None:
+                        total_solar_power += data[mppt_key]
+
             # Add aggregated metrics
             result = {
                 "devices": device_data,
+                # Aggregates are always rounded floats, clamped at 0, so the
+                # state type is stable and an unchanged poll yields an equal
+                # dict (always_update=False)
                 "aggregates": {
-                    "total_solar_power": total_solar_power,  # Always return value, 0 when no solar
-                    "total_solar_energy": round(total_solar_energy, 3)
-                    if total_solar_energy > 0
-                    else 0,
-                    "total_grid_export_energy": round(total_grid_export, 2)
-                    if total_grid_export > 0
-                    else 0,
-                    "daily_grid_export_energy": round(daily_grid_export, 2)
-                    if daily_grid_export > 0
-                    else 0,
+                    # Always return value, 0.0 when no solar
+                    "total_solar_power": round(max(float(total_solar_power), 0.0), 1),
+                    "total_solar_energy": round(max(total_solar_energy, 0.0), 3),
+                    "total_grid_export_energy": round(max(total_grid_export, 0.0), 2),
+                    "daily_grid_export_energy": round(max(daily_grid_export, 0.0), 2),
                 },
             }
 
+            self.data_version += 1
             return result
 
         except Exception as err:
@@ -181,6 +251,43 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
                 f"Error fetching device data for {self.family_name}: {err}"
             ) from err
 
+    def _update_devices(self, devices: list[dict[str, Any]]) -> None:
+        """Refresh ``self.devices`` from a fetched device list.
+
+        While the membership is unchanged the existing dicts are refreshed in
+        place, keeping ``self.devices`` and its entries identity-stable for
+        consumers; otherwise the map is rebuilt. A device coming back online
+        (e.g. rebooting after a firmware update) has its cached details
+        invalidated so the new firmware is picked up.
+        """
+        for device in devices:
+            device_id = str(device["deviceId"])
+            previous = self.devices.get(device_id)
+            if (
+                previous is not None
+                and device.get("status") == "Online"
+                and previous.get("status") != "Online"
+            ):
+                self.api_client.invalidate_device(device_id)
+
+        signature = tuple(
+            (str(device["deviceId"]), device.get("deviceType")) for device in devices
+        )
+        if signature != self._devices_signature:
+            self.devices = {
+                device_id: device
+                for (device_id, _), device in zip(signature, devices, strict=True)
+            }
+            self._devices_signature = signature
+            return
+
+        for (device_id, _), device in zip(signature, devices, strict=True):
+            existing = self.devices[device_id]
+            # Clearing a dict that is its own source would lose the data
+            if existing is not device:
+                existing.clear()
+                existing.update(device)
+
     async def _process_meter_device(
         self, device: dict, device_id: str, data: dict
     ) -> None:
@@ -296,15 +403,15 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
                     device_count,
                 )
 
-                # System-wide battery data
-                data["batterySoc"] = stats.get("batterySoc")
-                data["chargeRemaining"] = stats.get("chargeRemaining")
-                data["dischargeRemaining"] = stats.get("dischargeRemaining")
-
-                # Individual battery module SOCs - only for existing modules
-                for i in range(1, module_count + 1):
-                    soc_key = f"battery{i}Soc"
-                    data[soc_key] = stats.get(soc_key)
+                # System-wide SOC/MPPT data plus per-module SOC and MPPT data,
+                # only for existing modules
+                data.update({field: stats.get(field) for field in _SYSTEM_STAT_FIELDS})
+                data.update(
+                    {
+                        field: stats.get(field)
+                        for field in _module_stat_fields(module_count)
+                    }
+                )
 
                 # Stored energy (ENERGY_STORAGE) = SOC x nominal capacity. The
                 # system SOC covers the whole pack: the BK215 head unit plus the
@@ -320,24 +427,6 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
                             module_soc / 100 * BATTERY_MODULE_CAPACITY_KWH, 3
                         )
 
-                # MPPT data
-                mppt_fields = [
-                    "batteryMppt1InVol",
-                    "batteryMppt1InCur",
-                    "batteryMppt1InPower",
-                    "batteryMppt2InVol",
-                    "batteryMppt2InCur",
-                    "batteryMppt2InPower",
-                ]
-                for field in mppt_fields:
-                    data[field] = stats.get(field)
-
-                # Battery module MPPT data - only for existing modules
-                for module_num in range(1, module_count + 1):
-                    for suffix in ["Mppt1InVol", "Mppt1InCur", "Mppt1InPower"]:
-                        field = f"battery{module_num}{suffix}"
-                        data[field] = stats.get(field)
-
                 # Update power totals
                 if stats.get("inputPowerTotal") is not None:
                     data["input_power_total"] = stats["inputPowerTotal"]
@@ -388,8 +477,8 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
         slot index, i.e. the number of contiguous modules.
         """
         count = 0
-        for module_num in range(1, MAX_BATTERY_MODULE_SLOTS + 1):
-            if stats.get(f"battery{module_num}DeviceModel") is not None:
+        for module_num, model_key in enumerate(_MODULE_MODEL_KEYS, start=1):
+            if stats.get(model_key) is not None:
                 count = module_num
         return count
 
@@ -420,9 +509,9 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
         system_soc = data.get("batterySoc")
         if system_soc is not None:
             device_key = f"battery_{device_id}_system"
-            # Get SOC limits from family coordinator if available
-            limits = self._get_soc_limits()
-            self.event_manager.update_soc_state(device_key, system_soc, limits)
+            self.event_manager.update_soc_state(
+                device_key, system_soc, self._soc_limits
+            )
 
         # Individual module SOC events
         module_count = data.get("module_count", 1)
@@ -435,22 +524,35 @@ class SunlitDeviceCoordinator(DataUpdateCoordinator):
 
     def _get_soc_limits(self) -> dict[str, float] | None:
         """Get SOC limits from hass.data where family coordinator stores them."""
+        family_coordinator = self._family_coordinator
+        if family_coordinator is None:
+            family_coordinator = self._family_coordinator = (
+                self._find_family_coordinator()
+            )
+        if family_coordinator is None or not family_coordinator.data:
+            return None
+
+        family_data = family_coordinator.data.get("family", {})
+        return {
+            "strategy_min": family_data.get("strategy_soc_min"),
+            "strategy_max": family_data.get("strategy_soc_max"),
+            "bms_min": family_data.get("battery_soc_min"),
+            "bms_max": family_data.get("battery_soc_max"),
+            "hw_min": family_data.get("hw_soc_min"),
+            "hw_max": family_data.get("hw_soc_max"),
+        }
+
+    def _find_family_coordinator(self) -> DataUpdateCoordinator | None:
+        """Locate this family's coordinator in hass.data."""
         # Access family coordinator data through hass.data to get SOC limits
         try:
             domain_data = self.hass.data.get("sunlit", {})
             for entry_data in domain_data.values():
-                if isinstance(entry_data, dict) and self.family_id in entry_data:
-                    family_coordinator = entry_data[self.family_id].get("family")
-                    if family_coordinator and family_coordinator.data:
-                        family_data = family_coordinator.data.get("family", {})
-                        return {
-                            "strategy_min": family_data.get("strategy_soc_min"),
-                            "strategy_max": family_data.get("strategy_soc_max"),
-                            "bms_min": family_data.get("battery_soc_min"),
-                            "bms_max": family_data.get("battery_soc_max"),
-                            "hw_min": family_data.get("hw_soc_min"),
-                            "hw_max": family_data.get("hw_soc_max"),
-                        }
+                if not isinstance(entry_data, dict):
+                    continue
+                coordinators = entry_data.get("coordinators", entry_data)
+                if self.family_id in coordinators:
+                    return coordinators[self.family_id].get("family")
         except Exception:
             # Don't break if there are issues accessing family data
             pass
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from ..api_client import SunlitApiClient
-from ..const import BATTERY_MODULE_CAPACITY_KWH, DEFAULT_SCAN_INTERVAL
+from ..const import (
+    BATTERY_MODULE_CAPACITY_KWH,
+    DEFAULT_SCAN_INTERVAL,
+    FAMILY_SETTINGS_REFRESH_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    # Only used in annotations; the client is passed in by the integration setup
+    from ..api_client import SunlitApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,12 +39,19 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
         self.family_id = family_id
         self.family_name = family_name
         self.devices = {}  # Empty for compatibility with legacy code
+        # Slow-changing settings (SOC limits, charging-box strategy), merged
+        # into every refresh and re-fetched on FAMILY_SETTINGS_REFRESH_INTERVAL
+        self._settings: dict[str, Any] = {}
+        self._settings_fetched_at: float | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"Sunlit Family {family_name}",
             update_interval=DEFAULT_SCAN_INTERVAL,  # 30 seconds
+            # Each refresh builds a fresh dict, so unchanged polls can skip
+            # the listener callbacks
+            always_update=False,
         )
 
     def _is_midnight_window(self) -> bool:
@@ -83,47 +99,29 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
         try:
             family_data = {}
 
-            # Fetch space index for comprehensive family data
-            space_index = {}
-            try:
-                space_index = await self.api_client.fetch_space_index(self.family_id)
-                _LOGGER.debug(
-                    "Successfully fetched space index data for family %s",
-                    self.family_id,
-                )
-            except Exception as err:
-                _LOGGER.debug("Could not fetch space index data: %s", err)
-
-            # Process space index data
-            if space_index:
-                await self._process_space_index(space_index, family_data)
-
-            # Calculate device counts and fault status for regular families
-            await self._calculate_device_metrics(family_data)
-
-            # Fetch SOC limits
-            await self._fetch_soc_limits(family_data)
-
-            # Fetch lifetime yield & earnings totals
-            await self._fetch_lifetime_statistics(family_data)
-
-            # Fetch local-mode / UPS device status
-            await self._fetch_strategy_device_status(family_data)
-
-            # Fetch dynamic electricity tariff / pricing
-            await self._fetch_tariff(family_data)
-
-            # Fetch energy self-consumption rates
-            await self._fetch_energy_distribution(family_data)
-
-            # Fetch the latest notification for this family
-            await self._fetch_notifications(family_data)
-
-            # Fetch current strategy
-            await self._fetch_current_strategy(family_data)
-
-            # Fetch charging box strategy
-            await self._fetch_charging_box_strategy(family_data)
+            # The endpoints are independent and each helper writes its own
+            # keys (and handles its own errors), so fetch them concurrently
+            await asyncio.gather(
+                # Space index for comprehensive family data
+                self._fetch_space_index(family_data),
+                # Device counts and fault status for regular families
+                self._calculate_device_metrics(family_data),
+                # SOC limits and charging box strategy, on the slower cadence
+                self._refresh_settings(),
+                # Lifetime yield & earnings totals
+                self._fetch_lifetime_statistics(family_data),
+                # Local-mode / UPS device status
+                self._fetch_strategy_device_status(family_data),
+                # Dynamic electricity tariff / pricing
+                self._fetch_tariff(family_data),
+                # Energy self-consumption rates
+                self._fetch_energy_distribution(family_data),
+                # Latest notification for this family
+                self._fetch_notifications(family_data),
+                # Current strategy
+                self._fetch_current_strategy(family_data),
+            )
+            family_data.update(self._settings)
 
             return {"family": family_data}
 
@@ -132,6 +130,21 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
                 f"Error fetching family data for {self.family_name}: {err}"
             ) from err
 
+    async def _fetch_space_index(self, family_data: dict) -> None:
+        """Fetch and process the space index."""
+        space_index = {}
+        try:
+            space_index = await self.api_client.fetch_space_index(self.family_id)
+            _LOGGER.debug(
+                "Successfully fetched space index data for family %s",
+                self.family_id,
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not fetch space index data: %s", err)
+
+        if space_index:
+            await self._process_space_index(space_index, family_data)
+
     async def _process_space_index(self, space_index: dict, family_data: dict) -> None:
         """Process space index data."""
         # Today's metrics
@@ -203,8 +216,37 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
             family_data["boost_mode_enabled"] = boost_data.get("isOn", False)
             family_data["boost_mode_switching"] = boost_data.get("switching", False)
 
-    async def _fetch_soc_limits(self, family_data: dict) -> None:
-        """Fetch SOC limits."""
+    def invalidate_settings(self) -> None:
+        """Re-fetch the family settings on the next refresh.
+
+        Called after writes that change SOC limits or strategy, so the new
+        values show up without waiting out FAMILY_SETTINGS_REFRESH_INTERVAL.
+        """
+        self._settings_fetched_at = None
+
+    async def _refresh_settings(self) -> None:
+        """Re-fetch the slow-changing family settings once they are stale."""
+        now = time.monotonic()
+        if (
+            self._settings_fetched_at is not None
+            and now - self._settings_fetched_at
+            < FAMILY_SETTINGS_REFRESH_INTERVAL.total_seconds()
+        ):
+            return
+
+        settings: dict[str, Any] = {}
+        fetched = await asyncio.gather(
+            self._fetch_soc_limits(settings),
+            self._fetch_charging_box_strategy(settings),
+        )
+        # Merge so a failed call keeps its last good values, and only start a
+        # new interval once both succeeded; otherwise retry on the next poll
+        self._settings = {**self._settings, **settings}
+        if all(fetched):
+            self._settings_fetched_at = now
+
+    async def _fetch_soc_limits(self, family_data: dict) -> bool:
+        """Fetch SOC limits; return False if the request failed."""
         try:
             space_soc = await self.api_client.fetch_space_soc(self.family_id)
             if space_soc:
@@ -216,6 +258,8 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
                 family_data["strategy_soc_max"] = space_soc.get("strategySocMax")
         except Exception as err:
             _LOGGER.debug("Could not fetch space SOC data: %s", err)
+            return False
+        return True
 
     async def _fetch_lifetime_statistics(self, family_data: dict) -> None:
         """Fetch lifetime yield and earnings totals."""
@@ -225,8 +269,9 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
                 family_data["lifetime_yield"] = stats.get("totalYield")
                 earnings = stats.get("totalEarnings") or {}
                 family_data["lifetime_earnings"] = earnings.get("earnings")
-                # Fall back to the lifetime payload's currency if space/index
-                # did not already provide one.
+                # Fall back to the lifetime payload's currency. space/index
+                # assigns its currency unconditionally, so it wins whichever
+                # of the two concurrent fetches finishes first.
                 family_data.setdefault("currency", earnings.get("currency", "EUR"))
         except Exception as err:
             _LOGGER.debug("Could not fetch lifetime statistics: %s", err)
@@ -351,8 +396,8 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.debug("Could not fetch current strategy data: %s", err)
 
-    async def _fetch_charging_box_strategy(self, family_data: dict) -> None:
-        """Fetch charging box strategy."""
+    async def _fetch_charging_box_strategy(self, family_data: dict) -> bool:
+        """Fetch charging box strategy; return False if the request failed."""
         try:
             charging_box_data = await self.api_client.get_charging_box_strategy(
                 self.family_id
@@ -399,6 +444,8 @@ class SunlitFamilyCoordinator(DataUpdateCoordinator):
                 )
         except Exception as err:
             _LOGGER.debug("Could not fetch charging box strategy: %s", err)
+            return False
+        return True
 
     async def _calculate_device_metrics(self, family_data: dict) -> None:
         """Calculate device counts and fault status for regular families."""
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from functools import lru_cache
 import logging
+import math
 import time
 from typing import Any
 
@@ -19,6 +21,20 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_VERSION = 1
 # Debounce window for persisting accumulators after an update.
 SAVE_DELAY = 30
+# How often the running total is recomputed from the accumulators to shed
+# floating-point drift from the incremental updates.
+TOTAL_RESYNC_INTERVAL = 3600
+
+
+@lru_cache(maxsize=16)
+def _mppt_channel_keys(module_count: int) -> tuple[tuple[str, str], ...]:
+    """Return (power_key, energy_key) for every MPPT input of a battery.
+
+    The head unit has two inputs; each extension module adds one.
+    """
+    prefixes = [f"batteryMppt{num}" for num in (1, 2)]
+    prefixes += [f"battery{num}Mppt1" for num in range(1, module_count + 1)]
+    return tuple((f"{prefix}InPower", f"{prefix}Energy") for prefix in prefixes)
 
 
 class SunlitMpptEnergyCoordinator(DataUpdateCoordinator):
@@ -40,6 +56,16 @@ class SunlitMpptEnergyCoordinator(DataUpdateCoordinator):
         self.mppt_energy = {}
         self.last_mppt_update = {}
         self.last_mppt_power = {}
+        # Running sum of mppt_energy, updated with every increment
+        self._total_mppt_energy = 0.0
+        self._total_resynced_at: float | None = None
+        # (device_id, module_count) -> (power_key, energy_key, full_key) tuples
+        self._channel_cache: dict[
+            tuple[str, int], tuple[tuple[str, str, str], ...]
+        ] = {}
+        # device_id -> module count, valid for one device coordinator refresh
+        self._module_count_cache: dict[str, int] = {}
+        self._module_count_version: int | None = None
 
         # Persist accumulators so lifetime energy survives HA restarts.
         self._store: Store = Store(
@@ -52,6 +78,9 @@ class SunlitMpptEnergyCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"Sunlit MPPT Energy {family_name}",
             update_interval=timedelta(minutes=1),  # 1 minute updates
+            # Energies are rounded to 3 decimals, so idle channels produce
+            # equal results and listeners can be skipped
+            always_update=False,
         )
 
     @callback
@@ -85,7 +114,15 @@ class SunlitMpptEnergyCoordinator(DataUpdateCoordinator):
                 await self._async_restore_energy()
                 self._restored = True
 
-            current_time = time.time()
+            # Monotonic so wall-clock jumps (NTP, manual changes) can't
+            # produce negative or huge integration intervals
+            current_time = time.monotonic()
+            if (
+                self._total_resynced_at is None
+                or current_time - self._total_resynced_at >= TOTAL_RESYNC_INTERVAL
+            ):
+                self._total_mppt_energy = math.fsum(self.mppt_energy.values())
+                self._total_resynced_at = current_time
 
             mppt_data = {}
 
@@ -95,36 +132,32 @@ class SunlitMpptEnergyCoordinator(DataUpdateCoordinator):
 
             devices = self.device_coordinator.data.get("devices", {})
 
+            data_version = self.device_coordinator.data_version
+            if data_version != self._module_count_version:
+                self._module_count_cache.clear()
+                self._module_count_version = data_version
+
             for device_id, device_data in devices.items():
                 if device_data.get("deviceType") != "ENERGY_STORAGE_BATTERY":
                     continue
 
                 device_mppt = {}
-
-                # Main unit MPPT energy calculation
-                self._calculate_main_mppt_energy(
-                    device_id, device_data, device_mppt, current_time
-                )
-
-                # Battery module MPPT energy calculation
-                self._calculate_module_mppt_energy(
-                    device_id, device_data, device_mppt, current_time
-                )
+                for power_key, energy_key, full_key in self._channels(device_id):
+                    power = device_data.get(power_key)
+                    if power is not None:
+                        device_mppt[energy_key] = self._integrate(
+                            full_key, power, current_time
+                        )
 
                 if device_mppt:
                     mppt_data[device_id] = device_mppt
 
-            # Calculate total MPPT energy
-            total_mppt_energy = sum(
-                self.mppt_energy.get(key, 0) for key in self.mppt_energy
-            )
-
             # Persist accumulators (debounced) so they survive restarts.
             self._store.async_delay_save(self._data_to_store, SAVE_DELAY)
 
             return {
                 "mppt_energy": mppt_data,
-                "total_mppt_energy": round(total_mppt_energy, 3),
+                "total_mppt_energy": round(self._total_mppt_energy, 3),
             }
 
         except Exception as err:
@@ -133,76 +166,49 @@ class SunlitMpptEnergyCoordinator(DataUpdateCoordinator):
             )
             return {"mppt_energy": {}}
 
-    def _calculate_main_mppt_energy(
-        self,
-        device_id: str,
-        device_data: dict,
-        device_mppt: dict,
-        current_time: float,
-    ) -> None:
-        """Calculate energy for main unit MPPT inputs."""
-        for mppt_num in [1, 2]:
-            power_key = f"batteryMppt{mppt_num}InPower"
-            energy_key = f"batteryMppt{mppt_num}Energy"
-
-            if device_data.get(power_key) is not None:
-                power = device_data[power_key]
-                full_key = f"{device_id}_{energy_key}"
-
-                if full_key in self.mppt_energy:
-                    if full_key in self.last_mppt_update:
-                        time_delta_hours = (
-                            current_time - self.last_mppt_update[full_key]
-                        ) / 3600
-
-                        # Trapezoidal integration
-                        avg_power = (
-                            power + self.last_mppt_power.get(full_key, power)
-                        ) / 2
-
-                        energy_increment = (avg_power * time_delta_hours) / 1000
-                        self.mppt_energy[full_key] += energy_increment
-                else:
-                    self.mppt_energy[full_key] = 0
-
-                self.last_mppt_update[full_key] = current_time
-                self.last_mppt_power[full_key] = power
-                device_mppt[energy_key] = round(self.mppt_energy[full_key], 3)
-
-    def _calculate_module_mppt_energy(
-        self,
-        device_id: str,
-        device_data: dict,
-        device_mppt: dict,
-        current_time: float,
-    ) -> None:
-        """Calculate energy for battery module MPPT inputs."""
-        # Get actual number of battery modules for this device
-        module_count = self.device_coordinator.get_battery_module_count(device_id)
-
-        for module_num in range(1, module_count + 1):
-            power_key = f"battery{module_num}Mppt1InPower"
-            energy_key = f"battery{module_num}Mppt1Energy"
-
-            if device_data.get(power_key) is not None:
-                power = device_data[power_key]
-                full_key = f"{device_id}_{energy_key}"
-
-                if full_key in self.mppt_energy:
-                    if full_key in self.last_mppt_update:
-                        time_delta_hours = (
-                            current_time - self.last_mppt_update[full_key]
-                        ) / 3600
-
-                        avg_power = (
-                            power + self.last_mppt_power.get(full_key, power)
-                        ) / 2
-
-                        energy_increment = (avg_power * time_delta_hours) / 1000
-                        self.mppt_energy[full_key] += energy_increment
-                else:
-                    self.mppt_energy[full_key] = 0
-
-                self.last_mppt_update[full_key] = current_time
-                self.last_mppt_power[full_key] = power
-                device_mppt[energy_key] = round(self.mppt_energy[full_key], 3)
+    def _channels(self, device_id: str) -> tuple[tuple[str, str, str], ...]:
+        """Return the power, energy and accumulator keys of a battery's MPPTs.
+
+        Covers the head unit inputs plus one input per extension module; the
+        keys are built once per device and module count and reused.
+        """
+        module_count = self._module_count_cache.get(device_id)
+        if module_count is None:
+            module_count = self.device_coordinator.get_battery_module_count(device_id)
+            self._module_count_cache[device_id] = module_count
+
+        cache_key = (device_id, module_count)
+        channels = self._channel_cache.get(cache_key)
+        if channels is None:
+            channels = tuple(
+                (power_key, energy_key, f"{device_id}_{energy_key}")
+                for power_key, energy_key in _mppt_channel_keys(module_count)
+            )
+            self._channel_cache[cache_key] = channels
+        return channels
+
+    def _integrate(self, full_key: str, power: float, current_time: float) -> float:
+        """Add the energy since the last tick to a channel's accumulator.
+
+        Returns the accumulated energy in kWh, rounded to 3 decimals.
+        """
+        last_power = self.last_mppt_power.get(full_key)
+
+        if full_key not in self.mppt_energy:
+            self.mppt_energy[full_key] = 0
+        elif power == 0 and not last_power:
+            # Idle channel (e.g. at night): nothing to integrate
+            pass
+        elif full_key in self.last_mppt_update:
+            time_delta_hours = (current_time - self.last_mppt_update[full_key]) / 3600
+
+            # Trapezoidal integration
+            avg_power = (power + (power if last_power is None else last_power)) / 2
+
+            energy_increment = (avg_power * time_delta_hours) / 1000
+            self.mppt_energy[full_key] += energy_increment
+            self._total_mppt_energy += energy_increment
+
+        self.last_mppt_update[full_key] = current_time
+        self.last_mppt_power[full_key] = power
+        return round(self.mppt_energy[full_key], 3)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -19,9 +20,35 @@ from ..const import (
     DEFAULT_LOW_PRICE_SOC_MIN,
     DEFAULT_LOW_PRICE_STRATEGY,
 )
+from .family import SunlitFamilyCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window for strategy_changes_today, in the API's millisecond timestamps
+_DAY_MS = 86_400_000
+
+
+def _format_strategy_history(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Format history entries for the last_strategy_change attributes."""
+    formatted = []
+    for entry in entries:
+        if entry.get("modifyDate"):
+            timestamp = datetime.fromtimestamp(entry["modifyDate"] / 1000).isoformat()
+        else:
+            timestamp = "Unknown"
+
+        formatted.append(
+            {
+                "timestamp": timestamp,
+                "strategy": entry.get("strategy", "Unknown"),
+                "status": entry.get("status", "Unknown"),
+                "mode": entry.get("smartStrategyMode"),
+                "soc_min": entry.get("socMin"),
+                "soc_max": entry.get("socMax"),
+            }
+        )
+    return formatted
+
 
 class SunlitStrategyHistoryCoordinator(DataUpdateCoordinator):
     """Coordinator for strategy history data and tariff-strategy setup cache.
@@ -38,11 +65,14 @@ class SunlitStrategyHistoryCoordinator(DataUpdateCoordinator):
         api_client: SunlitApiClient,
         family_id: str,
         family_name: str,
+        family_coordinator: SunlitFamilyCoordinator | None = None,
     ) -> None:
         """Initialize the strategy history coordinator."""
         self.api_client = api_client
         self.family_id = family_id
         self.family_name = family_name
+        # Caches the SOC limits a tariff push changes; refreshed after pushes
+        self.family_coordinator = family_coordinator
 
         # Cached tariff-strategy setup. Mutated by entity setters and read by
         # set_tariff_strategy(). Initialised with sensible defaults; entities
@@ -66,6 +96,9 @@ class SunlitStrategyHistoryCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"Sunlit Strategy History {family_name}",
             update_interval=timedelta(minutes=5),  # 5 minute updates
+            # History payloads are plain dicts/lists, so unchanged polls
+            # compare equal and listeners can be skipped
+            always_update=False,
         )
 
     @property
@@ -101,6 +134,9 @@ class SunlitStrategyHistoryCoordinator(DataUpdateCoordinator):
             enable_switch_notice=enable_switch_notice,
         )
         await self.async_request_refresh()
+        if self.family_coordinator is not None:
+            self.family_coordinator.invalidate_settings()
+            await self.family_coordinator.async_request_refresh()
 
     async def _async_reconcile_tariff_setup_from_cloud(self) -> None:
         """Read the cloud's authoritative tariff setup and overwrite the cache.
@@ -139,10 +175,19 @@ class SunlitStrategyHistoryCoordinator(DataUpdateCoordinator):
         # Reconcile field by field, only overwriting fields we already know
         # about. Unknown fields the cloud might add later are ignored — they
         # would round-trip via the all-or-nothing push anyway.
+        changed = False
         for band, cloud_block in (("low", low_cloud), ("high", high_cloud)):
-            for field in list(self._tariff_setup[band].keys()):
-                if field in cloud_block and cloud_block[field] is not None:
-                    self._tariff_setup[band][field] = cloud_block[field]
+            cached_block = self._tariff_setup[band]
+            for field in list(cached_block.keys()):
+                value = cloud_block.get(field)
+                if value is not None and cached_block[field] != value:
+                    cached_block[field] = value
+                    changed = True
+
+        # The setup isn't part of the coordinator data, so an unchanged history
+        # would skip the listeners; notify the select/number entities directly.
+        if changed and self.data is not None:
+            self.async_update_listeners()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch strategy history data from REST API.
@@ -174,20 +219,27 @@ class SunlitStrategyHistoryCoordinator(DataUpdateCoordinator):
                     strategy_data["last_strategy_type"] = latest_entry.get("strategy")
                     strategy_data["last_strategy_status"] = latest_entry.get("status")
 
-                    # Count changes in last 24 hours
-                    now = datetime.now()
-                    day_ago = now - timedelta(days=1)
-                    day_ago_ms = int(day_ago.timestamp() * 1000)
-
-                    changes_today = sum(
-                        1
-                        for entry in history_entries
-                        if entry.get("modifyDate", 0) >= day_ago_ms
-                    )
+                    # Count changes in last 24 hours; entries are newest-first,
+                    # so stop at the first timestamp outside the window.
+                    # Entries without a timestamp are skipped, not counted.
+                    day_ago_ms = int(time.time() * 1000) - _DAY_MS
+                    changes_today = 0
+                    for entry in history_entries:
+                        modify_date = entry.get("modifyDate")
+                        if modify_date is None:
+                            continue
+                        if modify_date < day_ago_ms:
+                            break
+                        changes_today += 1
                     strategy_data["strategy_changes_today"] = changes_today
 
-                    # Store last 10 entries
-                    strategy_data["strategy_history"] = history_entries[:10]
+                    # Store last 10 entries, plus the attribute-ready form so
+                    # entities don't reformat them on every state write
+                    recent = history_entries[:10]
+                    strategy_data["strategy_history"] = recent
+                    strategy_data["strategy_history_formatted"] = (
+                        _format_strategy_history(recent)
+                    )
 
             return {"strategy": strategy_data}
 
@@ -1,5 +1,7 @@
 """Base utilities for Sunlit entities."""
 
+from functools import lru_cache
+
 from ..const import (
     DEVICE_TYPE_BATTERY,
     DEVICE_TYPE_INVERTER,
@@ -8,7 +10,25 @@ from ..const import (
     DEVICE_TYPE_METER_PRO,
 )
 
+_TYPE_MAP = {
+    DEVICE_TYPE_BATTERY: "battery",
+    DEVICE_TYPE_INVERTER: "inverter",
+    DEVICE_TYPE_INVERTER_SOLAR: "inverter",  # Generic solar inverter
+    DEVICE_TYPE_METER: "meter",
+    DEVICE_TYPE_METER_PRO: "meter",  # Shelly Pro variant
+}
+
 
+@lru_cache(maxsize=16)
+def family_slug(family_name: str) -> str:
+    """Return the family name as used in unique_ids (lowercase, underscores).
+
+    Shared by every entity of a family, so the result is cached per name.
+    """
+    return family_name.lower().replace(" ", "_")
+
+
+@lru_cache(maxsize=64)
 def normalize_device_type(device_type: str) -> str:
     """Normalize device type for use in unique_id.
 
@@ -18,14 +38,9 @@ def normalize_device_type(device_type: str) -> str:
     - SOLAR_MICRO_INVERTER -> inverter (generic solar inverter, includes DEYE)
     - SHELLY_3EM_METER -> meter
     - SHELLY_PRO3EM_METER -> meter (Shelly Pro 3EM variant)
+
+    Called once per entity during setup, so results are cached per type.
     """
-    type_map = {
-        DEVICE_TYPE_BATTERY: "battery",
-        DEVICE_TYPE_INVERTER: "inverter",
-        DEVICE_TYPE_INVERTER_SOLAR: "inverter",  # Generic solar inverter
-        DEVICE_TYPE_METER: "meter",
-        DEVICE_TYPE_METER_PRO: "meter",  # Shelly Pro variant
-    }
-    return type_map.get(
-        device_type, device_type.lower().replace("_", "").replace(" ", "")
-    )
+    if (normalized := _TYPE_MAP.get(device_type)) is not None:
+        return normalized
+    return device_type.lower().replace("_", "").replace(" ", "")
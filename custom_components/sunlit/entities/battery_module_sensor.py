@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
@@ -12,7 +13,9 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from ..const import DOMAIN
-from .base import normalize_device_type
+from .base import family_slug, normalize_device_type
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class SunlitBatteryModuleSensor(CoordinatorEntity, SensorEntity):
@@ -43,14 +46,38 @@ class SunlitBatteryModuleSensor(CoordinatorEntity, SensorEntity):
         self._module_number = module_number
         self._mppt_coordinator = mppt_coordinator
 
+        # Precomputed lookups for the native_value hot path
+        key = description.key
+        self._key = key
+        self._is_capacity = key.endswith("capacity")
+        self._is_mppt_energy = "Mppt1Energy" in key
+        self._is_mppt_key = "Mppt" in key
+        self._soc_key = f"battery{module_number}Soc"
+
         # Include module number in unique_id
         device_type = device_info_data.get("deviceType", "Device")
         normalized_type = normalize_device_type(device_type)
-        self._attr_unique_id = f"sunlit_{family_name.lower().replace(' ', '_')}_{family_id}_{normalized_type}_{device_id}_module{module_number}_{description.key}"
+        self._attr_unique_id = f"sunlit_{family_slug(family_name)}_{family_id}_{normalized_type}_{device_id}_module{module_number}_{description.key}"
 
         # Short friendly name for UI (used with has_entity_name)
         self._attr_name = description.name
 
+        # Device info and attributes are fixed for the entity's lifetime
+        device_sn = device_info_data.get("deviceSn", device_id)
+        # Virtual device for this battery module, linked to the main unit
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{device_sn}_module{module_number}")},
+            name=f"B215 {module_number} ({family_name})",
+            manufacturer="Highpower",
+            model="B215 Extension Module",
+            via_device=(DOMAIN, device_sn),
+        )
+        self._attr_extra_state_attributes = {
+            "main_device_id": device_id,
+            "module_number": module_number,
+            "parent_device_sn": device_info_data.get("deviceSn"),
+        }
+
     async def async_added_to_hass(self) -> None:
         """Subscribe to the MPPT coordinator in addition to the device coordinator.
 
@@ -73,88 +100,43 @@ class SunlitBatteryModuleSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> Any:
         """Return the state of the sensor."""
         # Special handling for static battery module capacity
-        if self.entity_description.key.endswith("capacity"):
+        if self._is_capacity:
             return 2.15  # kWh nominal capacity for B215 module
 
         # Handle MPPT energy values from MPPT coordinator
-        if (
-            self._mppt_coordinator
-            and "Mppt1Energy" in self.entity_description.key
-            and self._mppt_coordinator.data
-            and "mppt_energy" in self._mppt_coordinator.data
-            and self._device_id in self._mppt_coordinator.data["mppt_energy"]
-        ):
-            return self._mppt_coordinator.data["mppt_energy"][self._device_id].get(
-                self.entity_description.key
-            )
-
-        if (
-            self.coordinator.data
-            and "devices" in self.coordinator.data
-            and self._device_id in self.coordinator.data["devices"]
-        ):
-            value = self.coordinator.data["devices"][self._device_id].get(
-                self.entity_description.key
+        if self._is_mppt_energy and self._mppt_coordinator:
+            mppt_data = self._mppt_coordinator.data
+            energy = mppt_data.get("mppt_energy") if mppt_data else None
+            if energy and (device_energy := energy.get(self._device_id)) is not None:
+                return device_energy.get(self._key)
+
+        data = self.coordinator.data
+        devices = data.get("devices") if data else None
+        device = devices.get(self._device_id) if devices else None
+        if device is None:
+            return None
+
+        value = device.get(self._key)
+
+        # For MPPT sensors, return None (unavailable) instead of 0 if no data
+        # This prevents showing misleading 0 values when module is disconnected
+        # If module has SOC but MPPT is 0, it's likely disconnected
+        if self._is_mppt_key and value == 0 and device.get(self._soc_key) is not None:
+            _LOGGER.debug(
+                "Battery module %d has SOC but MPPT sensor '%s' is 0 - returning None for unavailable",
+                self._module_number,
+                self._key,
             )
+            return None  # Show as unavailable instead of 0
 
-            # For MPPT sensors, return None (unavailable) instead of 0 if no data
-            # This prevents showing misleading 0 values when module is disconnected
-            if value == 0 and "Mppt" in self.entity_description.key:
-                # Check if the module has SOC data (indicating it exists)
-                soc_key = f"battery{self._module_number}Soc"
-                has_soc = (
-                    self.coordinator.data["devices"][self._device_id].get(soc_key)
-                    is not None
-                )
-
-                # If module has SOC but MPPT is 0, it's likely disconnected
-                if has_soc:
-                    import logging
-
-                    _LOGGER = logging.getLogger(__name__)
-                    _LOGGER.debug(
-                        "Battery module %d has SOC but MPPT sensor '%s' is 0 - returning None for unavailable",
-                        self._module_number,
-                        self.entity_description.key,
-                    )
-                    return None  # Show as unavailable instead of 0
-
-            return value
-        return None
+        return value
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         # Entity is available as long as the device exists in the data
-        return (
-            self.coordinator.last_update_success
-            and "devices" in (self.coordinator.data or {})
-            and self._device_id in self.coordinator.data.get("devices", {})
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this virtual battery module."""
-        device_sn = self._device_info_data.get("deviceSn", self._device_id)
-
-        # Create a virtual device for this battery module
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{device_sn}_module{self._module_number}")},
-            name=f"B215 {self._module_number} ({self._family_name})",
-            manufacturer="Highpower",
-            model="B215 Extension Module",
-            via_device=(DOMAIN, device_sn),  # Links to main battery unit
-        )
-
-        return device_info
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        attrs = {
-            "main_device_id": self._device_id,
-            "module_number": self._module_number,
-            "parent_device_sn": self._device_info_data.get("deviceSn"),
-        }
-
-        return attrs
+        data = self.coordinator.data
+        if not (self.coordinator.last_update_success and data):
+            return False
+        devices = data.get("devices")
+        return devices is not None and self._device_id in devices
@@ -10,6 +10,9 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .device_sensor_base import SunlitDeviceSensorBase
 
+# Battery MPPT energy is integrated by the MPPT coordinator
+_MPPT_ENERGY_KEYS = frozenset({"batteryMppt1Energy", "batteryMppt2Energy"})
+
 
 class SunlitBatterySensor(SunlitDeviceSensorBase):
     """Representation of a Sunlit battery device sensor."""
@@ -37,6 +40,15 @@ class SunlitBatterySensor(SunlitDeviceSensorBase):
         )
         self._mppt_coordinator = mppt_coordinator
 
+        # Resolve the special-value handler for this key once; most keys have
+        # none and read straight from the device coordinator
+        if description.key == "battery_capacity":
+            self._value_handler = self._capacity_value
+        elif mppt_coordinator is not None and description.key in _MPPT_ENERGY_KEYS:
+            self._value_handler = self._mppt_energy_value
+        else:
+            self._value_handler = None
+
     async def async_added_to_hass(self) -> None:
         """Subscribe to the MPPT coordinator in addition to the device coordinator.
 
@@ -56,28 +68,23 @@ class SunlitBatterySensor(SunlitDeviceSensorBase):
 
     def _get_native_value(self) -> Any:
         """Handle special battery-specific values."""
-        # Special handling for static battery capacity
-        if self.entity_description.key == "battery_capacity":
-            return 2.15  # kWh nominal capacity for BK215
-
-        # Handle MPPT energy values from MPPT coordinator
-        if (
-            self._mppt_coordinator
-            and self.entity_description.key
-            in ["batteryMppt1Energy", "batteryMppt2Energy"]
-            and self._mppt_coordinator.data
-            and "mppt_energy" in self._mppt_coordinator.data
-            and self._device_id in self._mppt_coordinator.data["mppt_energy"]
-        ):
-            return self._mppt_coordinator.data["mppt_energy"][self._device_id].get(
-                self.entity_description.key
-            )
+        handler = self._value_handler
+        return handler() if handler is not None else None
+
+    def _capacity_value(self) -> float:
+        """Return the static nominal capacity."""
+        return 2.15  # kWh nominal capacity for BK215
 
-        return None
+    def _mppt_energy_value(self) -> Any:
+        """Return the MPPT energy integrated by the MPPT coordinator."""
+        try:
+            energy = self._mppt_coordinator.data["mppt_energy"][self._device_id]
+        except (KeyError, TypeError):
+            return None
+        return energy.get(self._key)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this battery device."""
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device info for this battery device."""
         base_info = self._get_base_device_info()
 
         # Use manufacturer from device data if available
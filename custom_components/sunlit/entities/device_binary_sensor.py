@@ -22,7 +22,33 @@ from ..const import (
     DEVICE_TYPE_METER_PRO,
     DOMAIN,
 )
-from .base import normalize_device_type
+from .base import family_slug, normalize_device_type
+
+# Friendly device names, manufacturers and models by device type
+_FRIENDLY_NAMES = {
+    DEVICE_TYPE_BATTERY: "BK215",
+    DEVICE_TYPE_INVERTER: "Microinverter",
+    DEVICE_TYPE_INVERTER_SOLAR: "Solar Inverter",
+    DEVICE_TYPE_METER: "Smart Meter",
+    DEVICE_TYPE_METER_PRO: "Smart Meter Pro",
+}
+
+# Fallback when the API doesn't report a manufacturer
+_MANUFACTURER_MAP = {
+    DEVICE_TYPE_BATTERY: "Highpower",
+    DEVICE_TYPE_INVERTER: "Yuneng",
+    DEVICE_TYPE_INVERTER_SOLAR: "Solar",  # Generic solar inverter
+    DEVICE_TYPE_METER: "Shelly",
+    DEVICE_TYPE_METER_PRO: "Shelly",
+}
+
+_MODEL_MAP = {
+    DEVICE_TYPE_BATTERY: "BK215",
+    DEVICE_TYPE_INVERTER: "Microinverter",
+    DEVICE_TYPE_INVERTER_SOLAR: "Micro Inverter",
+    DEVICE_TYPE_METER: "3EM Smart Meter",
+    DEVICE_TYPE_METER_PRO: "Pro 3EM Smart Meter",
+}
 
 
 class SunlitDeviceBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -52,86 +78,58 @@ class SunlitDeviceBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._device_info_data = device_info_data
         self._attr_icon = icon
         self._inverted = inverted
+        self._key = description.key
 
         # Include family_name, family_id and normalized device type in unique_id
         device_type = device_info_data.get("deviceType", "Device")
         normalized_type = normalize_device_type(device_type)
-        self._attr_unique_id = f"sunlit_{family_name.lower().replace(' ', '_')}_{family_id}_{normalized_type}_{device_id}_{description.key}"
+        self._attr_unique_id = f"sunlit_{family_slug(family_name)}_{family_id}_{normalized_type}_{device_id}_{description.key}"
 
         # Short friendly name for UI (used with has_entity_name)
         self._attr_name = description.name
 
+        # Device info and attributes are fixed for the entity's lifetime
+        self._attr_device_info = self._build_device_info()
+        self._attr_extra_state_attributes = {
+            "device_id": device_id,
+            "device_type": device_info_data.get("deviceType"),
+            "device_sn": device_info_data.get("deviceSn"),
+        }
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if (
-            self.coordinator.data
-            and "devices" in self.coordinator.data
-            and self._device_id in self.coordinator.data["devices"]
-        ):
-            value = self.coordinator.data["devices"][self._device_id].get(
-                self.entity_description.key
-            )
-            if value is not None:
-                # Apply inversion if needed (e.g., for "off" field)
-                return not bool(value) if self._inverted else bool(value)
-        return None
+        data = self.coordinator.data
+        devices = data.get("devices") if data else None
+        device = devices.get(self._device_id) if devices else None
+        if device is None or (value := device.get(self._key)) is None:
+            return None
+        # Apply inversion if needed (e.g., for "off" field)
+        return not bool(value) if self._inverted else bool(value)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and "devices" in (self.coordinator.data or {})
-            and self._device_id in self.coordinator.data.get("devices", {})
-            and self.entity_description.key
-            in self.coordinator.data["devices"][self._device_id]
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this device."""
+        data = self.coordinator.data
+        if not (self.coordinator.last_update_success and data):
+            return False
+        devices = data.get("devices")
+        device = devices.get(self._device_id) if devices else None
+        return device is not None and self._key in device
+
+    def _build_device_info(self) -> DeviceInfo:
+        """Build the device info for this device."""
         device_type = self._device_info_data.get("deviceType", "Unknown")
         device_sn = self._device_info_data.get("deviceSn", self._device_id)
 
-        # Map device types to friendly names
-        friendly_names = {
-            DEVICE_TYPE_BATTERY: "BK215",
-            DEVICE_TYPE_INVERTER: "Microinverter",
-            DEVICE_TYPE_INVERTER_SOLAR: "Solar Inverter",
-            DEVICE_TYPE_METER: "Smart Meter",
-            DEVICE_TYPE_METER_PRO: "Smart Meter Pro",
-        }
-
-        friendly_name = friendly_names.get(device_type, device_type)
+        friendly_name = _FRIENDLY_NAMES.get(device_type, device_type)
 
         # Use manufacturer from device data if available, otherwise map by type
         manufacturer = self._device_info_data.get("manufacturer")
-
         if not manufacturer:
-            # Fallback mapping if manufacturer not provided
-            if device_type in (DEVICE_TYPE_METER, DEVICE_TYPE_METER_PRO):
-                manufacturer = "Shelly"
-            elif device_type == DEVICE_TYPE_INVERTER:
-                manufacturer = "Yuneng"
-            elif device_type == DEVICE_TYPE_INVERTER_SOLAR:
-                # Generic solar inverter - try to get from device data
-                manufacturer = self._device_info_data.get("manufacturer", "Solar")
-            elif device_type == DEVICE_TYPE_BATTERY:
-                manufacturer = "Highpower"
-            else:
-                manufacturer = "Unknown"
-
-        # Map to model names
-        model_map = {
-            DEVICE_TYPE_BATTERY: "BK215",
-            DEVICE_TYPE_INVERTER: "Microinverter",
-            DEVICE_TYPE_INVERTER_SOLAR: "Micro Inverter",
-            DEVICE_TYPE_METER: "3EM Smart Meter",
-            DEVICE_TYPE_METER_PRO: "Pro 3EM Smart Meter",
-        }
+            manufacturer = _MANUFACTURER_MAP.get(device_type, "Unknown")
 
-        model_name = model_map.get(device_type, device_type)
+        model_name = _MODEL_MAP.get(device_type, device_type)
 
         device_info = DeviceInfo(
             identifiers={(DOMAIN, device_sn)},
@@ -151,14 +149,3 @@ class SunlitDeviceBinarySensor(CoordinatorEntity, BinarySensorEntity):
             device_info["hw_version"] = self._device_info_data["hwVersion"]
 
         return device_info
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        attrs = {
-            "device_id": self._device_id,
-            "device_type": self._device_info_data.get("deviceType"),
-            "device_sn": self._device_info_data.get("deviceSn"),
-        }
-
-        return attrs
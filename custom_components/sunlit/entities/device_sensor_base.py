@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -14,10 +15,17 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.util import dt as dt_util
 
-from ..const import DOMAIN
-from .base import normalize_device_type
+from ..const import DEVICE_TYPE_BATTERY, DEVICE_TYPE_INVERTER, DEVICE_TYPE_METER, DOMAIN
+from .base import family_slug, normalize_device_type
 from .helpers import is_daily_reset_total
 
+# Map device types to friendly device names
+_FRIENDLY_NAMES = {
+    DEVICE_TYPE_BATTERY: "BK215",
+    DEVICE_TYPE_INVERTER: "Microinverter",
+    DEVICE_TYPE_METER: "Smart Meter",
+}
+
 
 class SunlitDeviceSensorBase(CoordinatorEntity, SensorEntity, ABC):
     """Base representation of a Sunlit device sensor."""
@@ -42,15 +50,46 @@ class SunlitDeviceSensorBase(CoordinatorEntity, SensorEntity, ABC):
         self._family_name = family_name
         self._device_id = device_id
         self._device_info_data = device_info_data
+        self._key = description.key
+        self._is_daily_reset = is_daily_reset_total(description.key)
+        self._last_snapshot: tuple[Any, ...] | None = None
 
         # Include family_name, family_id and normalized device type in unique_id
         device_type = device_info_data.get("deviceType", "Device")
         normalized_type = normalize_device_type(device_type)
-        self._attr_unique_id = f"sunlit_{family_name.lower().replace(' ', '_')}_{family_id}_{normalized_type}_{device_id}_{description.key}"
+        self._attr_unique_id = f"sunlit_{family_slug(family_name)}_{family_id}_{normalized_type}_{device_id}_{description.key}"
 
         # Short friendly name for UI (used with has_entity_name)
         self._attr_name = description.name
 
+        # Device info and the static attributes are fixed for the entity's
+        # lifetime
+        self._attr_device_info = self._build_device_info()
+        self._static_attributes = {
+            "device_id": device_id,
+            "device_type": device_info_data.get("deviceType"),
+            "device_sn": device_info_data.get("deviceSn"),
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if what the entity reports has changed.
+
+        Coordinators refresh all entities at once; most sensors keep the same
+        value between polls, so an identical snapshot skips the state write.
+        The snapshot covers every property that feeds the written state.
+        """
+        snapshot = (
+            self.available,
+            self.native_value,
+            self.last_reset,
+            self.extra_state_attributes,
+        )
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
@@ -60,20 +99,16 @@ class SunlitDeviceSensorBase(CoordinatorEntity, SensorEntity, ABC):
             return value
 
         # Default behavior: get from coordinator data
-        if (
-            self.coordinator.data
-            and "devices" in self.coordinator.data
-            and self._device_id in self.coordinator.data["devices"]
-        ):
-            return self.coordinator.data["devices"][self._device_id].get(
-                self.entity_description.key
-            )
-        return None
+        try:
+            device_data = self.coordinator.data["devices"][self._device_id]
+        except (KeyError, TypeError):
+            return None
+        return device_data.get(self._key)
 
     @property
     def last_reset(self) -> datetime | None:
         """Local midnight for daily-resetting TOTAL sensors (e.g. daily_earnings)."""
-        if is_daily_reset_total(self.entity_description.key):
+        if self._is_daily_reset:
             return dt_util.start_of_local_day()
         return None
 
@@ -86,31 +121,26 @@ class SunlitDeviceSensorBase(CoordinatorEntity, SensorEntity, ABC):
         """Return if entity is available."""
         # Entity is available as long as the device exists in the data
         # Even if the specific sensor value is not present (None/null)
-        return (
-            self.coordinator.last_update_success
-            and "devices" in (self.coordinator.data or {})
-            and self._device_id in self.coordinator.data.get("devices", {})
-        )
+        data = self.coordinator.data
+        if not (self.coordinator.last_update_success and data):
+            return False
+        devices = data.get("devices")
+        return devices is not None and self._device_id in devices
 
-    @property
     @abstractmethod
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this device - must be implemented by subclass."""
-        pass
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device info for this device - must be implemented by subclass.
+
+        Called once from ``__init__``; the result is cached as the entity's
+        device info.
+        """
 
     def _get_base_device_info(self) -> dict[str, Any]:
         """Get common device info fields."""
         device_sn = self._device_info_data.get("deviceSn", self._device_id)
         device_type = self._device_info_data.get("deviceType", "Unknown")
 
-        # Map device types to friendly names
-        friendly_names = {
-            "ENERGY_STORAGE_BATTERY": "BK215",
-            "YUNENG_MICRO_INVERTER": "Microinverter",
-            "SHELLY_3EM_METER": "Smart Meter",
-        }
-
-        friendly_name = friendly_names.get(device_type, device_type)
+        friendly_name = _FRIENDLY_NAMES.get(device_type, device_type)
 
         base_info = {
             "identifiers": {(DOMAIN, device_sn)},
@@ -133,22 +163,17 @@ class SunlitDeviceSensorBase(CoordinatorEntity, SensorEntity, ABC):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        attrs = {
-            "device_id": self._device_id,
-            "device_type": self._device_info_data.get("deviceType"),
-            "device_sn": self._device_info_data.get("deviceSn"),
-        }
+        attrs = dict(self._static_attributes)
 
         # Add device-specific attributes from coordinator data
-        if (
-            "devices" in (self.coordinator.data or {})
-            and self._device_id in self.coordinator.data["devices"]
-        ):
+        try:
             device_data = self.coordinator.data["devices"][self._device_id]
-            if "fault" in device_data:
-                attrs["fault"] = device_data["fault"]
-            if "off" in device_data:
-                attrs["off"] = device_data["off"]
+        except (KeyError, TypeError):
+            device_data = {}
+        if "fault" in device_data:
+            attrs["fault"] = device_data["fault"]
+        if "off" in device_data:
+            attrs["off"] = device_data["off"]
 
         # Add additional device info if available
         if "systemMultiStatus" in self._device_info_data:
@@ -14,7 +14,7 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from ..const import DOMAIN
-from .base import normalize_device_type
+from .base import family_slug, normalize_device_type
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,11 +51,22 @@ class SunlitBatteryLocalModeSwitch(CoordinatorEntity, SwitchEntity):
         device_type = device_info_data.get("deviceType", "Device")
         normalized_type = normalize_device_type(device_type)
         self._attr_unique_id = (
-            f"sunlit_{family_name.lower().replace(' ', '_')}_{family_id}_"
+            f"sunlit_{family_slug(family_name)}_{family_id}_"
             f"{normalized_type}_{device_id}_local_mode"
         )
         self._attr_name = "Local Mode"
 
+        # Attach to the battery device created by the other platforms; fixed
+        # for the entity's lifetime
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_info_data.get("deviceSn", device_id))},
+            via_device=(DOMAIN, f"family_{family_id}"),
+        )
+        self._attr_extra_state_attributes = {
+            "device_id": device_id,
+            "device_sn": self._device_sn,
+        }
+
     def _device_data(self) -> dict[str, Any] | None:
         """Return this device's entry from the coordinator data."""
         data = self.coordinator.data or {}
@@ -79,23 +90,6 @@ class SunlitBatteryLocalModeSwitch(CoordinatorEntity, SwitchEntity):
             and device.get("local_mode_enabled") is not None
         )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Attach to the battery device created by the other platforms."""
-        device_sn = self._device_info_data.get("deviceSn", self._device_id)
-        return DeviceInfo(
-            identifiers={(DOMAIN, device_sn)},
-            via_device=(DOMAIN, f"family_{self._family_id}"),
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "device_id": self._device_id,
-            "device_sn": self._device_sn,
-        }
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable local mode."""
         await self._set_local_mode(True)
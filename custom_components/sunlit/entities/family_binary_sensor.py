@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
@@ -15,6 +13,7 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from ..const import DOMAIN
+from .base import family_slug
 
 
 class SunlitFamilyBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -38,45 +37,43 @@ class SunlitFamilyBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._family_id = family_id
         self._family_name = family_name
         self._attr_icon = icon
+        self._key = description.key
 
         # Include family_id in unique_id to ensure uniqueness across families
-        self._attr_unique_id = f"sunlit_{family_name.lower().replace(' ', '_')}_{family_id}_{description.key}"
+        self._attr_unique_id = (
+            f"sunlit_{family_slug(family_name)}_{family_id}_{description.key}"
+        )
 
         # Short friendly name for UI (used with has_entity_name)
         self._attr_name = description.name
 
+        # Attached to the family hub device; fixed for the entity's lifetime
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"family_{family_id}")},
+            name=f"{family_name} Solar System",
+            manufacturer="Sunlit Solar",
+            model="Solar Management Hub",
+            configuration_url="https://sunlitsolar.de",
+        )
+        self._attr_extra_state_attributes = {
+            "family_id": family_id,
+            "family_name": family_name,
+        }
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.coordinator.data and "family" in self.coordinator.data:
-            value = self.coordinator.data["family"].get(self.entity_description.key)
-            if value is not None:
-                return bool(value)
-        return None
+        data = self.coordinator.data
+        family = data.get("family") if data else None
+        if family is None or (value := family.get(self._key)) is None:
+            return None
+        return bool(value)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and (
-            "family" in (self.coordinator.data or {})
-            and self.entity_description.key in (self.coordinator.data.get("family", {}))
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the family hub."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"family_{self._family_id}")},
-            name=f"{self._family_name} Solar System",
-            manufacturer="Sunlit Solar",
-            model="Solar Management Hub",
-            configuration_url="https://sunlitsolar.de",
-        )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        return {
-            "family_id": self._family_id,
-            "family_name": self._family_name,
-        }
+        data = self.coordinator.data
+        if not (self.coordinator.last_update_success and data):
+            return False
+        family = data.get("family")
+        return family is not None and self._key in family
@@ -7,6 +7,7 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -22,8 +23,13 @@ from ..const import (
     SENSOR_GROUP_STRATEGY,
     SENSOR_GROUPS,
 )
+from .base import family_slug
 from .helpers import is_daily_reset_total
 
+# Data section each coordinator publishes its family-level values under, in
+# lookup order: device (aggregates), strategy, MPPT, family
+_DATA_SECTIONS = ("aggregates", "strategy", "mppt_energy", "family")
+
 
 class SunlitFamilySensor(CoordinatorEntity, SensorEntity):
     """Representation of a Sunlit family aggregate sensor."""
@@ -44,161 +50,140 @@ class SunlitFamilySensor(CoordinatorEntity, SensorEntity):
         self._entry_id = entry_id
         self._family_id = family_id
         self._family_name = family_name
+        self._key = description.key
+        self._is_daily_reset = is_daily_reset_total(description.key)
+        # The MPPT coordinator exposes the family rollup at the top level (its
+        # "mppt_energy" section is keyed by device id, not sensor key); every
+        # other key lives in the coordinator's section, resolved on first data
+        self._top_level = description.key == "total_mppt_energy"
+        self._section: str | None = None
+        self._last_snapshot: tuple[Any, ...] | None = None
 
         # Include family_id in unique_id to ensure uniqueness across families
-        self._attr_unique_id = f"sunlit_{family_name.lower().replace(' ', '_')}_{family_id}_{description.key}"
+        self._attr_unique_id = (
+            f"sunlit_{family_slug(family_name)}_{family_id}_{description.key}"
+        )
 
         # Short friendly name for UI (used with has_entity_name)
         self._attr_name = description.name
 
-    @property
-    def entity_category(self) -> EntityCategory | None:
-        """Return the entity category based on sensor group."""
-        sensor_group = SENSOR_GROUPS.get(self.entity_description.key)
-
-        if sensor_group in (
+        # Category follows the sensor group; all non-primary sensors are
+        # diagnostic (sensors cannot use CONFIG category). Overview, energy,
+        # and financial sensors are primary (no category).
+        if SENSOR_GROUPS.get(description.key) in (
             SENSOR_GROUP_BATTERY,
             SENSOR_GROUP_STRATEGY,
             SENSOR_GROUP_INFO,
             SENSOR_GROUP_STATUS,
         ):
-            # All non-primary sensors are diagnostic (sensors cannot use CONFIG category)
-            return EntityCategory.DIAGNOSTIC
-
-        # Overview, energy, and financial sensors are primary (no category)
-        return None
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        else:
+            self._attr_entity_category = None
+
+        # Attached to the family hub device; fixed for the entity's lifetime
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"family_{family_id}")},
+            name=f"{family_name} Solar System",
+            manufacturer="Sunlit Solar",
+            model="Solar Management Hub",
+            configuration_url="https://sunlitsolar.de",
+        )
+        self._static_attributes = {
+            "family_id": family_id,
+            "family_name": family_name,
+        }
 
     @property
     def last_reset(self) -> datetime | None:
         """Local midnight for daily-resetting TOTAL sensors (daily_earnings)."""
-        if is_daily_reset_total(self.entity_description.key):
+        if self._is_daily_reset:
             return dt_util.start_of_local_day()
         return None
 
+    def _section_data(self) -> dict[str, Any] | None:
+        """Return the part of the coordinator data holding this sensor's key.
+
+        The coordinator type is fixed per entity, so the section found on the
+        first read is reused; it is only looked up again if it disappears.
+        """
+        data = self.coordinator.data
+        if not data or self._top_level:
+            return data or None
+        if (
+            self._section is not None
+            and (section_data := data.get(self._section)) is not None
+        ):
+            return section_data
+        self._section = next((name for name in _DATA_SECTIONS if name in data), None)
+        return data[self._section] if self._section is not None else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if what the entity reports has changed.
+
+        Coordinators refresh all entities at once; most sensors keep the same
+        value between polls, so an identical snapshot skips the state write.
+        The snapshot covers every property that feeds the written state.
+        """
+        snapshot = (
+            self.available,
+            self.native_value,
+            self.last_reset,
+            self.extra_state_attributes,
+        )
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.coordinator.data:
-            value = None
-
-            # MPPT coordinator exposes the family rollup at the top level
-            # (its "mppt_energy" section is keyed by device id, not sensor key).
-            if self.entity_description.key == "total_mppt_energy":
-                return self.coordinator.data.get("total_mppt_energy")
-
-            # Check the appropriate section based on coordinator type
-            # Device coordinator uses aggregates
-            if "aggregates" in self.coordinator.data:
-                value = self.coordinator.data["aggregates"].get(
-                    self.entity_description.key
-                )
-            # Strategy coordinator uses strategy
-            elif "strategy" in self.coordinator.data:
-                value = self.coordinator.data["strategy"].get(
-                    self.entity_description.key
-                )
-            # MPPT coordinator uses mppt_energy
-            elif "mppt_energy" in self.coordinator.data:
-                value = self.coordinator.data["mppt_energy"].get(
-                    self.entity_description.key
-                )
-            # Family coordinator uses family
-            elif "family" in self.coordinator.data:
-                value = self.coordinator.data["family"].get(self.entity_description.key)
-
-            # Convert timestamp from milliseconds to datetime for timestamp sensors
-            if self.entity_description.key == "last_strategy_change" and value:
-                return datetime.fromtimestamp(value / 1000, tz=UTC)
-
-            return value
-        return None
+        section = self._section_data()
+        if section is None:
+            return None
+        return section.get(self._key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.last_update_success or not self.coordinator.data:
+        if not self.coordinator.last_update_success:
             return False
-
-        # Check if the key exists in the appropriate data section
-        # Match the order used in native_value for consistency
-        if self.entity_description.key == "total_mppt_energy":
-            return "total_mppt_energy" in self.coordinator.data
-        if "aggregates" in self.coordinator.data:
-            return self.entity_description.key in self.coordinator.data.get(
-                "aggregates", {}
-            )
-        elif "strategy" in self.coordinator.data:
-            return self.entity_description.key in self.coordinator.data.get(
-                "strategy", {}
-            )
-        elif "mppt_energy" in self.coordinator.data:
-            return self.entity_description.key in self.coordinator.data.get(
-                "mppt_energy", {}
-            )
-        elif "family" in self.coordinator.data:
-            return self.entity_description.key in self.coordinator.data.get(
-                "family", {}
-            )
-
-        return False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the family hub."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"family_{self._family_id}")},
-            name=f"{self._family_name} Solar System",
-            manufacturer="Sunlit Solar",
-            model="Solar Management Hub",
-            configuration_url="https://sunlitsolar.de",
-        )
+        section = self._section_data()
+        return section is not None and self._key in section
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        attrs = {
-            "family_id": self._family_id,
-            "family_name": self._family_name,
-        }
-
-        # Add strategy history if available
-        if (
-            self.entity_description.key == "last_strategy_change"
-            and self.coordinator.data
-            and "family" in self.coordinator.data
-        ):
-            history = self.coordinator.data["family"].get("strategy_history", [])
-            if history:
-                # Format history for display
-                formatted_history = []
-                for entry in history[:10]:  # Last 10 entries
-                    if entry.get("modifyDate"):
-                        timestamp = datetime.fromtimestamp(
-                            entry["modifyDate"] / 1000
-                        ).isoformat()
-                    else:
-                        timestamp = "Unknown"
-
-                    formatted_history.append(
-                        {
-                            "timestamp": timestamp,
-                            "strategy": entry.get("strategy", "Unknown"),
-                            "status": entry.get("status", "Unknown"),
-                            "mode": entry.get("smartStrategyMode"),
-                            "soc_min": entry.get("socMin"),
-                            "soc_max": entry.get("socMax"),
-                        }
-                    )
-                attrs["history"] = formatted_history
+        attrs = dict(self._static_attributes)
 
         # Add notification detail if available
-        if (
-            self.entity_description.key == "latest_notification"
-            and self.coordinator.data
-            and "family" in self.coordinator.data
-        ):
-            detail = self.coordinator.data["family"].get("latest_notification_detail")
+        if self._key == "latest_notification":
+            section = self._section_data()
+            detail = section.get("latest_notification_detail") if section else None
             if detail:
                 attrs.update(detail)
 
         return attrs
+
+
+class SunlitFamilyTimestampSensor(SunlitFamilySensor):
+    """Family sensor for last_strategy_change, a millisecond API timestamp."""
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the timestamp as a timezone-aware datetime."""
+        value = super().native_value
+        return datetime.fromtimestamp(value / 1000, tz=UTC) if value else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes, including the recent strategy history."""
+        attrs = super().extra_state_attributes
+
+        # Formatted once per poll by the strategy coordinator
+        section = self._section_data()
+        history = section.get("strategy_history_formatted") if section else None
+        if history:
+            attrs["history"] = history
+        return attrs
@@ -1,5 +1,6 @@
 """Helper functions for Sunlit sensors."""
 
+from functools import lru_cache
 import re
 
 from homeassistant.components.sensor import (
@@ -48,14 +49,46 @@ _METERED_SOC_KEYS = {
 }
 _MODULE_SOC_RE = re.compile(r"^battery\d+Soc$")
 
+# Fixed key groups shared by the classification helpers below.
+_GRID_EXPORT_ENERGY_KEYS = frozenset(
+    {"total_grid_export_energy", "daily_grid_export_energy"}
+)
+_YIELD_KEYS = frozenset({"daily_yield", "lifetime_yield"})
+# Energy totals despite "power"/"yield" in their names
+_GENERATION_TOTAL_KEYS = frozenset({"total_power_generation", "total_yield"})
+_EARNINGS_KEYS = frozenset({"daily_earnings", "lifetime_earnings"})
+_RATE_KEYS = frozenset({"self_use_rate", "self_sufficiency_rate"})
+_ELECTRICITY_PRICE_KEYS = frozenset(
+    {
+        "electricity_price",
+        "electricity_price_avg",
+        "electricity_price_high",
+        "electricity_price_low",
+    }
+)
+# Numeric measurements that carry no device class (counts, prices, rates).
+_UNCLASSIFIED_MEASUREMENT_KEYS = frozenset(
+    {
+        "device_count",
+        "online_devices",
+        "offline_devices",
+        "strategy_changes_today",
+    }
+    | _ELECTRICITY_PRICE_KEYS
+    | _RATE_KEYS
+)
+
 
 def _is_metered_battery_soc(key: str) -> bool:
     """Return True for fluctuating, metered battery SOC sensors only."""
     return key in _METERED_SOC_KEYS or _MODULE_SOC_RE.match(key) is not None
 
 
+@lru_cache(maxsize=256)
 def get_device_class_for_sensor(key: str) -> SensorDeviceClass | None:
     """Get the appropriate device class for a sensor."""
+    lowered = key.lower()
+    compact = lowered.replace("_", "")
     # Check specific keys first before general pattern matching
     if key == "last_strategy_change":
         return SensorDeviceClass.TIMESTAMP
@@ -64,27 +97,27 @@ def get_device_class_for_sensor(key: str) -> SensorDeviceClass | None:
         return SensorDeviceClass.ENUM
     # Check for status and strategy fields (they're text, not numeric)
     elif (
-        "status" in key.lower()
-        or "strategy" in key.lower()
-        or key in ["currency", "battery_count"]
+        "status" in lowered
+        or "strategy" in lowered
+        or key in ("currency", "battery_count")
         or key == "battery_full"
     ):
         return None
     # Stored energy: current energy in the battery (kWh). Must precede the
     # generic "energy"/"battery" checks so it is not mis-classified as ENERGY.
-    elif "storedenergy" in key.lower().replace("_", ""):
+    elif "storedenergy" in compact:
         return SensorDeviceClass.ENERGY_STORAGE
     # Cumulative/flow energy. Nominal capacity is intentionally NOT here: it is a
     # static spec value, not metered energy (see get_entity_category -> diagnostic).
     elif (
-        "mpptenergy" in key.lower().replace("_", "").replace(" ", "")
+        "mpptenergy" in compact.replace(" ", "")
         or key == "total_solar_energy"
-        or key in ["total_grid_export_energy", "daily_grid_export_energy"]
-        or key in ["daily_yield", "lifetime_yield"]
+        or key in _GRID_EXPORT_ENERGY_KEYS
+        or key in _YIELD_KEYS
     ):
         return SensorDeviceClass.ENERGY
     # Earnings are monetary
-    elif key in ["daily_earnings", "lifetime_earnings"]:
+    elif key in _EARNINGS_KEYS:
         return SensorDeviceClass.MONETARY
     # Home power
     elif key == "home_power":
@@ -93,23 +126,21 @@ def get_device_class_for_sensor(key: str) -> SensorDeviceClass | None:
     elif key == "wifi_rssi":
         return SensorDeviceClass.SIGNAL_STRENGTH
     # Time remaining sensors
-    elif "remaining" in key.lower():
+    elif "remaining" in lowered:
         return SensorDeviceClass.DURATION
     # MPPT voltage sensors
-    elif "invol" in key.lower() or "voltage" in key.lower():
+    elif "invol" in lowered or "voltage" in lowered:
         return SensorDeviceClass.VOLTAGE
     # total_power_generation and total_yield are actually energy despite the name
-    elif key in ["total_power_generation", "total_yield"]:
+    elif key in _GENERATION_TOTAL_KEYS:
         return SensorDeviceClass.ENERGY
     # Check power BEFORE current to catch "current_power" correctly
-    elif "power" in key.lower():
+    elif "power" in lowered:
         return SensorDeviceClass.POWER
     # MPPT current sensors - more specific check to avoid catching "current_power"
-    elif "incur" in key.lower() or (
-        key.lower().endswith("_current") or key.lower() == "current"
-    ):
+    elif "incur" in lowered or (lowered.endswith("_current") or lowered == "current"):
         return SensorDeviceClass.CURRENT
-    elif "energy" in key.lower():
+    elif "energy" in lowered:
         return SensorDeviceClass.ENERGY
     # BATTERY only for metered, fluctuating SOC — not for SOC limit thresholds.
     elif _is_metered_battery_soc(key):
@@ -119,26 +150,24 @@ def get_device_class_for_sensor(key: str) -> SensorDeviceClass | None:
     return None
 
 
+@lru_cache(maxsize=256)
 def get_state_class_for_sensor(key: str) -> SensorStateClass | None:
     """Get the appropriate state class for a sensor."""
+    lowered = key.lower()
+    compact = lowered.replace("_", "")
     # Stored energy fluctuates (rises and falls) -> MEASUREMENT, never TOTAL*.
-    if "storedenergy" in key.lower().replace("_", ""):
+    if "storedenergy" in compact:
         return SensorStateClass.MEASUREMENT
     # Monetary totals must use TOTAL — MONETARY forbids TOTAL_INCREASING. The
     # daily-resetting one (daily_earnings) carries a last_reset (see the entity's
     # last_reset property) so the midnight reset is handled correctly.
-    if key in ("lifetime_earnings", "daily_earnings"):
+    if key in _EARNINGS_KEYS:
         return SensorStateClass.TOTAL
     # Energy: lifetime totals AND daily counters are modelled as TOTAL_INCREASING.
     # For the daily counters, TOTAL_INCREASING auto-detects the midnight reset
     # (the value drops to ~0), so no last_reset attribute is needed and the
     # long-term statistics stay correct across the reset.
-    if "energy" in key.lower() or key in (
-        "total_yield",
-        "lifetime_yield",
-        "daily_yield",
-        "total_power_generation",
-    ):
+    if "energy" in lowered or key in _YIELD_KEYS or key in _GENERATION_TOTAL_KEYS:
         return SensorStateClass.TOTAL_INCREASING
     # Measurement-type device classes opt into long-term statistics. This covers
     # power (incl. rated_power / max_output_power), voltage, current, metered
@@ -153,101 +182,88 @@ def get_state_class_for_sensor(key: str) -> SensorStateClass | None:
         SensorDeviceClass.SIGNAL_STRENGTH,
     ):
         return SensorStateClass.MEASUREMENT
-    # Numeric measurements that carry no device class (counts, prices, rates).
-    if key in [
-        "device_count",
-        "online_devices",
-        "offline_devices",
-        "strategy_changes_today",
-        "electricity_price",
-        "electricity_price_avg",
-        "electricity_price_high",
-        "electricity_price_low",
-        "self_use_rate",
-        "self_sufficiency_rate",
-    ]:
+    if key in _UNCLASSIFIED_MEASUREMENT_KEYS:
         return SensorStateClass.MEASUREMENT
     return None
 
 
+@lru_cache(maxsize=256)
 def get_unit_for_sensor(key: str) -> str | None:
     """Get the appropriate unit for a sensor."""
+    lowered = key.lower()
+    compact = lowered.replace("_", "")
     # Stored energy (kWh)
-    if "storedenergy" in key.lower().replace("_", ""):
+    if "storedenergy" in compact:
         return UnitOfEnergy.KILO_WATT_HOUR
     # Battery capacity
     if (
-        "capacity" in key.lower()
-        or "mpptenergy" in key.lower().replace("_", "").replace(" ", "")
+        "capacity" in lowered
+        or "mpptenergy" in compact.replace(" ", "")
         or key == "total_solar_energy"
-        or key in ["total_grid_export_energy", "daily_grid_export_energy"]
-        or key in ["daily_yield", "lifetime_yield"]
-        or key in ["total_power_generation", "total_yield"]
+        or key in _GRID_EXPORT_ENERGY_KEYS
+        or key in _YIELD_KEYS
+        or key in _GENERATION_TOTAL_KEYS
     ):
         return UnitOfEnergy.KILO_WATT_HOUR
     # WiFi RSSI (t475 -> negative dB)
     elif key == "wifi_rssi":
         return SIGNAL_STRENGTH_DECIBELS
     # Time remaining sensors
-    elif "remaining" in key.lower():
+    elif "remaining" in lowered:
         return UnitOfTime.MINUTES
     # MPPT voltage sensors
-    elif "invol" in key.lower() or "voltage" in key.lower():
+    elif "invol" in lowered or "voltage" in lowered:
         return UnitOfElectricPotential.VOLT
     # Ensure rated_power and max_output_power get W units
     # Check power BEFORE current to catch "current_power" correctly
     elif (
         key
-        in [
+        in (
             "rated_power",
             "max_output_power",
             "home_power",
             "inverter_current_power",
             "current_power",
-        ]
-        or "power" in key.lower()
+        )
+        or "power" in lowered
     ):
         return UnitOfPower.WATT
     # MPPT current sensors - more specific check to avoid catching "current_power"
-    elif "incur" in key.lower() or (
-        key.lower().endswith("_current") or key.lower() == "current"
-    ):
+    elif "incur" in lowered or (lowered.endswith("_current") or lowered == "current"):
         return UnitOfElectricCurrent.AMPERE
-    elif "energy" in key.lower():
+    elif "energy" in lowered:
         return UnitOfEnergy.KILO_WATT_HOUR
     elif (
-        "soc" in key.lower() or "battery_level" in key or "average_battery_level" in key
-    ) or key in ("self_use_rate", "self_sufficiency_rate"):
+        "soc" in lowered or "battery_level" in key or "average_battery_level" in key
+    ) or key in _RATE_KEYS:
         return PERCENTAGE
-    elif key in (
-        "electricity_price",
-        "electricity_price_avg",
-        "electricity_price_high",
-        "electricity_price_low",
-    ):
+    elif key in _ELECTRICITY_PRICE_KEYS:
         return "ct/kWh"
     elif "earnings" in key:
         return "EUR"  # Could be made configurable, will use currency field
     return None
 
 
+@lru_cache(maxsize=256)
 def get_icon_for_sensor(key: str, device_type: str = None) -> str | None:
     """Get the appropriate icon for a sensor."""
+    lowered = key.lower()
+    compact = lowered.replace("_", "")
     # MPPT (Maximum Power Point Tracking) related
-    if "mppt" in key.lower():
-        if "vol" in key.lower():
+    if "mppt" in lowered:
+        if "vol" in lowered:
             return "mdi:sine-wave"
-        elif "cur" in key.lower():
+        elif "cur" in lowered:
             return "mdi:current-dc"
-        elif "power" in key.lower():
+        elif "power" in lowered:
             return "mdi:solar-power-variant"
         else:
             return "mdi:solar-panel-large"
     # Time remaining
-    elif "remaining" in key.lower():
-        if "charge" in key.lower():
+    elif "remaining" in lowered:
+        if "charge" in lowered:
             return "mdi:timer-sand"
-        elif "discharge" in key.lower():
+        elif "discharge" in lowered:
             return "mdi:timer-sand-empty"
     # Device diagnostics (#159) — before device_type branches so battery
     # devices don't fall through to the generic battery icon.
@@ -267,14 +283,14 @@ def get_icon_for_sensor(key: str, device_type: str = None) -> str | None:
     elif key == "total_grid_export_energy" or key == "daily_grid_export_energy":
         return "mdi:transmission-tower-export"
     # Stored energy (before generic battery icons)
-    elif "storedenergy" in key.lower().replace("_", ""):
+    elif "storedenergy" in compact:
         return "mdi:home-battery"
     # Battery related
     elif "battery_full" in key:
         return "mdi:battery-check"
     elif "battery_level" in key or "average_battery_level" in key:
         return "mdi:battery-50"
-    elif "batterysoc" in key.lower() or "soc" in key.lower():
+    elif "batterysoc" in lowered or "soc" in lowered:
         return "mdi:battery-outline"
     elif device_type == "ENERGY_STORAGE_BATTERY":
         if "input" in key:
@@ -350,7 +366,7 @@ def get_icon_for_sensor(key: str, device_type: str = None) -> str | None:
     elif key.startswith("electricity_price"):
         return "mdi:cash-multiple"
     # Yield (daily / lifetime)
-    elif key in ("daily_yield", "lifetime_yield"):
+    elif key in _YIELD_KEYS:
         return "mdi:solar-power-variant"
     # Home power
     elif key == "home_power":
@@ -422,8 +438,13 @@ def get_suggested_display_precision(key: str) -> int | None:
     return None
 
 
+@lru_cache(maxsize=256)
 def build_sensor_description(key: str, name: str) -> SensorEntityDescription:
-    """Build a SensorEntityDescription with all derived metadata for a key."""
+    """Build a SensorEntityDescription with all derived metadata for a key.
+
+    Descriptions are frozen, so one instance is shared by every entity with
+    the same key and name (e.g. the same sensor across several devices).
+    """
     return SensorEntityDescription(
         key=key,
         name=name,
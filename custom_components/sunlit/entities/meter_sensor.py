@@ -11,9 +11,8 @@ from .device_sensor_base import SunlitDeviceSensorBase
 class SunlitMeterSensor(SunlitDeviceSensorBase):
     """Representation of a Sunlit meter device sensor."""
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this meter device."""
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device info for this meter device."""
         base_info = self._get_base_device_info()
         device_type = self._device_info_data.get("deviceType")
 
@@ -10,9 +10,8 @@ from .device_sensor_base import SunlitDeviceSensorBase
 class SunlitUnknownDeviceSensor(SunlitDeviceSensorBase):
     """Representation of a Sunlit unknown/unsupported device sensor."""
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this unknown device."""
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device info for this unknown device."""
         base_info = self._get_base_device_info()
 
         # Use manufacturer from device data if available, otherwise "Unknown"
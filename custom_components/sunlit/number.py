@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
@@ -17,6 +15,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .api_client import SunlitApiError
 from .const import DOMAIN
 from .coordinators.strategy import SunlitStrategyHistoryCoordinator
+from .entities.base import family_slug
 
 # (band, field, friendly suffix)
 _NUMBER_FIELDS: list[tuple[str, str, str]] = [
@@ -94,9 +93,14 @@ class SunlitTariffSocNumber(
         self._band = band
         self._field = field
 
-        slug = family_name.lower().replace(" ", "_")
+        slug = family_slug(family_name)
         self._attr_unique_id = f"sunlit_{slug}_{family_id}_tariff_{band}_{field}"
         self._attr_name = name_suffix
+        # Attach to the family device; band/field exposed for diagnostics
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"family_{family_id}")}
+        )
+        self._attr_extra_state_attributes = {"band": band, "field": field}
 
     @property
     def native_value(self) -> float | None:
@@ -106,11 +110,6 @@ class SunlitTariffSocNumber(
             return None
         return float(value)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Attach to the family device."""
-        return DeviceInfo(identifiers={(DOMAIN, f"family_{self._family_id}")})
-
     async def async_added_to_hass(self) -> None:
         """Restore last value into the coordinator cache."""
         await super().async_added_to_hass()
@@ -151,8 +150,3 @@ class SunlitTariffSocNumber(
                 f"Failed to set {self._band}-price {self._field}: {err}"
             ) from err
         self.async_write_ha_state()
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Expose band/field for diagnostics."""
-        return {"band": self._band, "field": self._field}
@@ -16,6 +16,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .api_client import SunlitApiError
 from .const import DOMAIN, TARIFF_STRATEGY_OPTIONS
 from .coordinators.strategy import SunlitStrategyHistoryCoordinator
+from .entities.base import family_slug
 
 
 async def async_setup_entry(
@@ -90,21 +91,20 @@ class SunlitTariffStrategySelect(
         self._family_name = family_name
         self._band = band  # "low" | "high"
 
-        slug = family_name.lower().replace(" ", "_")
+        slug = family_slug(family_name)
         self._attr_unique_id = f"sunlit_{slug}_{family_id}_tariff_strategy_{band}"
         nice = "Low Price" if band == "low" else "High Price"
         self._attr_name = f"{nice} Strategy"
+        # Attach to the family device
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"family_{family_id}")}
+        )
 
     @property
     def current_option(self) -> str | None:
         """Return the cached strategy for this band."""
         return self.coordinator.tariff_setup[self._band].get("strategy")
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Attach to the family device."""
-        return DeviceInfo(identifiers={(DOMAIN, f"family_{self._family_id}")})
-
     async def async_added_to_hass(self) -> None:
         """Restore the previously selected option from state cache."""
         await super().async_added_to_hass()
@@ -24,7 +24,7 @@ from .const import (
 )
 from .entities.battery_module_sensor import SunlitBatteryModuleSensor
 from .entities.battery_sensor import SunlitBatterySensor
-from .entities.family_sensor import SunlitFamilySensor
+from .entities.family_sensor import SunlitFamilySensor, SunlitFamilyTimestampSensor
 from .entities.helpers import (
     build_sensor_description,
     get_icon_for_sensor,
@@ -158,7 +158,12 @@ async def async_setup_entry(
                         else:
                             coord = family_coordinator
 
-                        sensor = SunlitFamilySensor(
+                        sensor_cls = (
+                            SunlitFamilyTimestampSensor
+                            if key == "last_strategy_change"
+                            else SunlitFamilySensor
+                        )
+                        sensor = sensor_cls(
                             coordinator=coord,
                             description=sensor_description,
                             entry_id=config_entry.entry_id,
@@ -1,5 +1,7 @@
 """Tests for the Sunlit API client."""
 
+import asyncio
+import gc
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,6 +15,7 @@ from custom_components.sunlit.api_client import (
     SunlitConnectionError,
     _format_api_message,
 )
+from custom_components.sunlit.const import MAX_CONCURRENT_API_REQUESTS
 
 
 @pytest.fixture
@@ -38,6 +41,7 @@ def setup_mock_response(mock_session, status, json_data=None, text_data=None):
         mock_response.json = AsyncMock(return_value=json_data)
     if text_data is not None:
         mock_response.text = AsyncMock(return_value=text_data)
+        mock_response.content.read = AsyncMock(return_value=text_data.encode())
 
     # Create context manager
     mock_context = AsyncMock()
@@ -95,6 +99,26 @@ async def test_fetch_families_success(api_client, mock_session):
     assert call_args[1]["headers"]["Authorization"] == "Bearer test_token"
 
 
+@pytest.mark.asyncio
+async def test_headers_reused_until_token_changes(api_client, mock_session):
+    """Request headers are built once and rebuilt after a new login token."""
+    setup_mock_response(mock_session, 200, {"code": 0, "content": []})
+    await api_client.fetch_families()
+    await api_client.fetch_families()
+
+    first, second = (c[1]["headers"] for c in mock_session.request.call_args_list)
+    assert first is second
+
+    setup_mock_response(
+        mock_session, 200, {"code": 0, "content": {"access_token": "new_token"}}
+    )
+    await api_client.login("user@example.com", "secret")
+    await api_client.fetch_families()
+
+    headers = mock_session.request.call_args[1]["headers"]
+    assert headers["Authorization"] == "Bearer new_token"
+
+
 @pytest.mark.asyncio
 async def test_fetch_families_auth_error(api_client, mock_session):
     """Test authentication error when fetching families."""
@@ -121,6 +145,19 @@ async def test_fetch_families_connection_error(api_client, mock_session):
     assert "API request failed with status 500" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_error_body_is_truncated(api_client, mock_session):
+    """Only the head of an HTTP error body is read into the message."""
+    response = setup_mock_response(mock_session, 502, text_data="Bad Gateway")
+
+    with pytest.raises(SunlitConnectionError) as exc_info:
+        await api_client.fetch_families()
+
+    assert "status 502: Bad Gateway" in str(exc_info.value)
+    response.content.read.assert_awaited_once_with(512)
+    response.text.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_fetch_families_api_error(api_client, mock_session):
     """Test API error response."""
@@ -284,6 +321,18 @@ async def test_timeout_error(api_client, mock_session):
     assert "Request timeout" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_request_uses_client_timeout(api_client, mock_session):
+    """The request timeout is handed to aiohttp instead of wrapped around it."""
+    setup_mock_response(mock_session, 200, {"code": 0, "content": []})
+
+    await api_client.fetch_families()
+
+    timeout = mock_session.request.call_args[1]["timeout"]
+    assert isinstance(timeout, aiohttp.ClientTimeout)
+    assert timeout.total == 10
+
+
 @pytest.mark.asyncio
 async def test_client_error(api_client, mock_session):
     """Test aiohttp client error handling."""
@@ -667,6 +716,90 @@ async def test_fetch_device_statistics_connection_error(api_client, mock_session
     assert "API request failed with status 500" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_concurrent_identical_fetches_share_one_request(
+    api_client, mock_session
+):
+    """Concurrent calls with the same arguments are coalesced."""
+    response = setup_mock_response(mock_session, 200)
+
+    async def slow_json(**kwargs):
+        await asyncio.sleep(0)
+        return {"code": 0, "content": {"batterySoc": 80}}
+
+    response.json = slow_json
+
+    first, second, other = await asyncio.gather(
+        api_client.fetch_device_statistics(41714),
+        api_client.fetch_device_statistics("41714"),
+        api_client.fetch_device_statistics(55478),
+    )
+
+    assert first == second == other == {"batterySoc": 80}
+    assert mock_session.request.call_count == 2
+
+    # Completed requests are not reused
+    await api_client.fetch_device_statistics(41714)
+    assert mock_session.request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_orphaned_shared_fetch_error_is_retrieved(api_client, mock_session):
+    """A shared request whose callers were all cancelled still gets reaped."""
+    response = setup_mock_response(mock_session, 200)
+    release = asyncio.Event()
+
+    async def failing_json(**kwargs):
+        await release.wait()
+        raise aiohttp.ClientError("boom")
+
+    response.json = failing_json
+
+    caller = asyncio.ensure_future(api_client.fetch_device_statistics(41714))
+    await asyncio.sleep(0)
+    (task,) = api_client._inflight.values()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    loop = asyncio.get_running_loop()
+    exception_handler = MagicMock()
+    loop.set_exception_handler(exception_handler)
+    try:
+        release.set()
+        await asyncio.wait([task])
+        assert task.done() and not task.cancelled()
+        assert api_client._inflight == {}
+
+        # No "Task exception was never retrieved" once the task is collected
+        del task, caller
+        gc.collect()
+        exception_handler.assert_not_called()
+    finally:
+        loop.set_exception_handler(None)
+
+
+@pytest.mark.asyncio
+async def test_async_close_cancels_inflight_requests(api_client, mock_session):
+    """Closing the client cancels shared requests nobody waits for any more."""
+    response = setup_mock_response(mock_session, 200)
+
+    async def hanging_json(**kwargs):
+        await asyncio.Event().wait()
+
+    response.json = hanging_json
+
+    caller = asyncio.ensure_future(api_client.fetch_device_statistics(41714))
+    await asyncio.sleep(0)
+    (task,) = api_client._inflight.values()
+    caller.cancel()
+
+    await api_client.async_close()
+
+    assert task.cancelled()
+    assert api_client._inflight == {}
+
+
 @pytest.mark.asyncio
 async def test_fetch_battery_io_power_success(api_client, mock_session):
     """Test successful fetching of battery IO power statistics."""
@@ -964,6 +1097,74 @@ async def test_fetch_device_details_connection_error(api_client, mock_session):
     assert "API request failed with status 500" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_fetch_device_details_cached(api_client, mock_session):
+    """Repeated detail fetches within the TTL are served from the cache."""
+    setup_mock_response(
+        mock_session,
+        200,
+        {
+            "code": 0,
+            "message": {"DE": "Ok"},
+            "content": {"deviceId": 41714, "deviceSn": "dcbdccbffe3d"},
+        },
+    )
+
+    first = await api_client.fetch_device_details(41714)
+    second = await api_client.fetch_device_details("41714")
+
+    assert first == second
+    mock_session.request.assert_called_once()
+
+    # Callers get their own copy; mutating it leaves the cache intact
+    second["deviceSn"] = "changed"
+    third = await api_client.fetch_device_details(41714)
+    assert third["deviceSn"] == "dcbdccbffe3d"
+
+    # Explicit invalidation forces a refetch
+    api_client.invalidate_device(41714)
+    await api_client.fetch_device_details(41714)
+    assert mock_session.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_device_details_not_cached_during_ota(api_client, mock_session):
+    """Details are refetched while a firmware update is in progress."""
+    setup_mock_response(
+        mock_session,
+        200,
+        {
+            "code": 0,
+            "message": {"DE": "Ok"},
+            "content": {"deviceId": 41714, "otaInProgress": True},
+        },
+    )
+
+    await api_client.fetch_device_details(41714)
+    await api_client.fetch_device_details(41714)
+
+    assert mock_session.request.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_battery_local_mode_invalidates_details(api_client, mock_session):
+    """Toggling local mode drops the cached details for that battery."""
+    setup_mock_response(
+        mock_session,
+        200,
+        {
+            "code": 0,
+            "message": {"DE": "Ok"},
+            "content": {"deviceId": 41714, "deviceSn": "dcbdccbffe3d"},
+        },
+    )
+    await api_client.fetch_device_details(41714)
+    await api_client.update_battery_local_mode("dcbdccbffe3d", True)
+    await api_client.fetch_device_details(41714)
+
+    assert mock_session.request.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_fetch_device_list_success(api_client, mock_session):
     """Test successful device list fetch with multiple device types."""
@@ -1063,6 +1264,13 @@ async def test_fetch_device_list_with_type_filter(api_client, mock_session):
     assert len(devices) == 1
     assert devices[0]["deviceType"] == "ENERGY_STORAGE_BATTERY"
 
+    # The body is sent as pre-serialized JSON bytes
+    call_args = mock_session.request.call_args
+    assert json.loads(call_args[1]["data"]) == {
+        "familyId": 34038,
+        "deviceType": "ENERGY_STORAGE_BATTERY",
+    }
+
 
 @pytest.mark.asyncio
 async def test_fetch_device_list_empty(api_client, mock_session):
@@ -1079,6 +1287,59 @@ async def test_fetch_device_list_empty(api_client, mock_session):
     assert devices == []
 
 
+@pytest.mark.asyncio
+async def test_fetch_device_list_cached(api_client, mock_session):
+    """Repeated device list fetches within the TTL are served from the cache."""
+    response_data = {
+        "code": 0,
+        "content": {"content": [{"deviceId": 41714}], "totalElements": 1},
+    }
+    setup_mock_response(mock_session, 200, response_data)
+
+    first = await api_client.fetch_device_list(34038)
+    second = await api_client.fetch_device_list("34038")
+
+    assert first == second == [{"deviceId": 41714}]
+    mock_session.request.assert_called_once()
+
+    # Callers get their own copy; mutating it leaves the cache intact
+    second[0]["deviceId"] = 0
+    second.clear()
+    assert await api_client.fetch_device_list(34038) == [{"deviceId": 41714}]
+
+    # A different device type filter is a separate request
+    await api_client.fetch_device_list(34038, "ENERGY_STORAGE_BATTERY")
+    assert mock_session.request.call_count == 2
+
+    # Clearing the cache forces a refetch
+    api_client.invalidate_device()
+    await api_client.fetch_device_list(34038)
+    assert mock_session.request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_bounded(api_client, mock_session):
+    """Requests beyond the client limit wait for a free slot."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_json(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"code": 0, "content": {}}
+
+    response = setup_mock_response(mock_session, 200)
+    response.json = slow_json
+
+    await asyncio.gather(*(api_client.fetch_device_details(i) for i in range(25)))
+
+    assert mock_session.request.call_count == 25
+    assert peak == MAX_CONCURRENT_API_REQUESTS
+
+
 @pytest.mark.asyncio
 async def test_fetch_device_list_auth_error(api_client, mock_session):
     """Test device list fetch handles authentication errors."""
@@ -0,0 +1,177 @@
+"""Tests for the Sunlit binary sensor platform."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.sunlit.binary_sensor import (
+    DEVICE_BINARY_SENSORS,
+    FAMILY_BINARY_SENSORS,
+    async_setup_entry,
+)
+from custom_components.sunlit.const import DOMAIN
+from custom_components.sunlit.coordinators.device import SunlitDeviceCoordinator
+from custom_components.sunlit.coordinators.family import SunlitFamilyCoordinator
+
+
+@pytest.fixture
+def family_coordinator():
+    """Family coordinator with a couple of binary-sensor fields."""
+    coordinator = MagicMock(spec=SunlitFamilyCoordinator)
+    coordinator.family_id = "34038"
+    coordinator.family_name = "Garage"
+    coordinator.data = {
+        "family": {"has_fault": False, "battery_full": True, "device_count": 3}
+    }
+    return coordinator
+
+
+@pytest.fixture
+def device_coordinator():
+    """Device coordinator with one battery and one meter."""
+    coordinator = MagicMock(spec=SunlitDeviceCoordinator)
+    coordinator.family_id = "34038"
+    coordinator.family_name = "Garage"
+    coordinator.devices = {
+        "41714": {"deviceId": 41714, "deviceType": "ENERGY_STORAGE_BATTERY"},
+        "55478": {"deviceId": 55478, "deviceType": "SHELLY_3EM_METER"},
+    }
+    coordinator.data = {
+        "devices": {
+            "41714": {"fault": False, "off": False, "ota_in_progress": False},
+            "55478": {"total_ac_power": 120},
+        }
+    }
+    return coordinator
+
+
+def _setup_args(family_coordinator, device_coordinator):
+    """Build hass/config_entry/async_add_entities mocks for the platform."""
+    config_entry = MagicMock()
+    config_entry.entry_id = "entry"
+    hass = MagicMock()
+    hass.data = {
+        DOMAIN: {
+            "entry": {
+                "coordinators": {
+                    "34038": {
+                        "family": family_coordinator,
+                        "device": device_coordinator,
+                    }
+                }
+            }
+        }
+    }
+    return hass, config_entry, MagicMock()
+
+
+async def test_setup_creates_present_sensors(family_coordinator, device_coordinator):
+    """Only keys present in the coordinator data become entities."""
+    hass, config_entry, async_add_entities = _setup_args(
+        family_coordinator, device_coordinator
+    )
+
+    await async_setup_entry(hass, config_entry, async_add_entities)
+
+    entities = async_add_entities.call_args[0][0]
+    keys = sorted(entity.entity_description.key for entity in entities)
+    assert keys == ["battery_full", "fault", "has_fault", "off", "ota_in_progress"]
+
+
+async def test_setup_adds_entities_appearing_later(
+    family_coordinator, device_coordinator
+):
+    """Keys and devices showing up after setup are added on refresh."""
+    family_coordinator.data = None
+    hass, config_entry, async_add_entities = _setup_args(
+        family_coordinator, device_coordinator
+    )
+
+    await async_setup_entry(hass, config_entry, async_add_entities)
+
+    # Device entities are added right away; family entities wait
+    initial = async_add_entities.call_args[0][0]
+    assert {e.entity_description.key for e in initial} == {
+        "fault",
+        "off",
+        "ota_in_progress",
+    }
+
+    family_listener = family_coordinator.async_add_listener.call_args[0][0]
+    device_listener = device_coordinator.async_add_listener.call_args[0][0]
+
+    family_coordinator.data = {"family": {"has_fault": True}}
+    family_listener()
+
+    late = async_add_entities.call_args[0][0]
+    assert [e.entity_description.key for e in late] == ["has_fault"]
+
+    # Refreshes without anything new don't add entities again
+    family_listener()
+    device_listener()
+    assert async_add_entities.call_count == 2
+
+    # A device added later gets its entities
+    device_coordinator.devices["41715"] = {
+        "deviceId": 41715,
+        "deviceType": "ENERGY_STORAGE_BATTERY",
+    }
+    device_coordinator.data["devices"]["41715"] = {"fault": False}
+    device_listener()
+
+    late = async_add_entities.call_args[0][0]
+    assert [(e._device_id, e.entity_description.key) for e in late] == [
+        ("41715", "fault")
+    ]
+
+    # Listeners are removed when the entry unloads
+    assert config_entry.async_on_unload.call_count == 2
+
+
+async def test_device_binary_sensor_state_and_availability(
+    family_coordinator, device_coordinator
+):
+    """Device binary sensors need their key in the device data to be available."""
+    device_coordinator.last_update_success = True
+    hass, config_entry, async_add_entities = _setup_args(
+        family_coordinator, device_coordinator
+    )
+    await async_setup_entry(hass, config_entry, async_add_entities)
+    entities = {
+        entity.entity_description.key: entity
+        for entity in async_add_entities.call_args[0][0]
+    }
+
+    fault = entities["fault"]
+    assert fault.available
+    assert fault.is_on is False
+
+    device_coordinator.data["devices"]["41714"]["fault"] = True
+    assert fault.is_on is True
+
+    del device_coordinator.data["devices"]["41714"]["fault"]
+    assert not fault.available
+    assert fault.is_on is None
+
+    device_coordinator.data = None
+    assert not fault.available
+    assert fault.is_on is None
+
+
+async def test_setup_creates_sensors_in_definition_order(
+    family_coordinator, device_coordinator
+):
+    """Entities are created in definition order, whatever the payload order."""
+    family_coordinator.data = {
+        "family": {"battery_full": True, "device_count": 3, "has_fault": False}
+    }
+    hass, config_entry, async_add_entities = _setup_args(
+        family_coordinator, device_coordinator
+    )
+
+    await async_setup_entry(hass, config_entry, async_add_entities)
+
+    keys = [e.entity_description.key for e in async_add_entities.call_args[0][0]]
+    family_keys = [key for key in FAMILY_BINARY_SENSORS if key in keys]
+    device_keys = [key for key in DEVICE_BINARY_SENSORS if key in keys]
+    assert keys == family_keys + device_keys
@@ -1,5 +1,6 @@
 """Test the Sunlit config flow."""
 
+import hashlib
 from ipaddress import ip_address
 from unittest.mock import AsyncMock, patch
 
@@ -7,6 +8,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.sunlit import DOMAIN
 from custom_components.sunlit.api_client import SunlitAuthError, SunlitConnectionError
@@ -308,6 +310,30 @@ async def test_form_duplicate_entry(
     assert result["reason"] == "already_configured"
 
 
+async def test_form_duplicate_account(hass: HomeAssistant):
+    """Re-adding an account aborts on the email hash before logging in."""
+    MockConfigEntry(
+        domain=DOMAIN,
+        data={"access_token": "test_token_123", "families": []},
+        unique_id=hashlib.md5(b"test@example.com").hexdigest()[:8],
+    ).add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch(
+        "custom_components.sunlit.config_flow.SunlitApiClient",
+    ) as mock_client_class:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {"email": "test@example.com", "password": "test_password"},
+        )
+
+    assert result2["type"] == FlowResultType.ABORT
+    assert result2["reason"] == "already_configured"
+    mock_client_class.return_value.login.assert_not_called()
+
+
 async def test_zeroconf_discovery_shows_confirm(hass: HomeAssistant):
     """A discovered BK215 should present a confirmation step."""
     result = await hass.config_entries.flow.async_init(
@@ -1,6 +1,7 @@
 """Test the Sunlit device coordinator."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
@@ -206,6 +207,8 @@ async def test_device_coordinator_inverter_variations(
     aggregates = data["aggregates"]
     # Inverters are OUTPUT devices, not solar generators, so total_solar_power should be 0
     assert aggregates["total_solar_power"] == 0  # No MPPT inputs = 0W solar
+    # Still a float, so the sensor's state type doesn't flip between polls
+    assert isinstance(aggregates["total_solar_power"], float)
     assert aggregates["total_solar_energy"] == 300  # 100 + 200
 
 
@@ -329,3 +332,158 @@ async def test_device_coordinator_solar_micro_inverter_processing(
     assert devices["inverter_deye_002"]["total_power_generation"] == 156.7
     assert devices["inverter_deye_002"]["daily_earnings"] == 15.2
     assert devices["inverter_deye_002"]["total_yield"] == 250.3
+
+
+async def test_device_coordinator_fetches_statistics_concurrently(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """Statistics for online devices are requested in parallel."""
+    api_client = AsyncMock()
+    api_client.fetch_device_list.return_value = [
+        {
+            "deviceId": f"meter_{index}",
+            "deviceType": "SHELLY_3EM_METER",
+            "status": "Online",
+        }
+        for index in range(3)
+    ]
+
+    in_flight = 0
+    peak = 0
+
+    async def fetch_stats(device_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"totalAcPower": 100}
+
+    api_client.fetch_device_statistics.side_effect = fetch_stats
+
+    coordinator = SunlitDeviceCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+    )
+
+    data = await coordinator._async_update_data()
+
+    assert peak == 3
+    assert all(device["totalacpower"] == 100 for device in data["devices"].values())
+
+
+async def test_device_coordinator_passes_family_soc_limits(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """SOC events receive the limits from the family coordinator."""
+    family_coordinator = MagicMock()
+    family_coordinator.data = {
+        "family": {"strategy_soc_min": 10, "strategy_soc_max": 95}
+    }
+    hass.data["sunlit"] = {
+        "entry": {"coordinators": {"34038": {"family": family_coordinator}}}
+    }
+
+    api_client = AsyncMock()
+    api_client.fetch_device_list.return_value = [
+        {
+            "deviceId": "battery_001",
+            "deviceType": "ENERGY_STORAGE_BATTERY",
+            "status": "Online",
+        },
+    ]
+    api_client.fetch_device_statistics.return_value = {"batterySoc": 55}
+    event_manager = MagicMock()
+
+    coordinator = SunlitDeviceCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+        event_manager=event_manager,
+    )
+
+    await coordinator._async_update_data()
+
+    _, soc, limits = event_manager.update_soc_state.call_args_list[0][0]
+    assert soc == 55
+    assert limits["strategy_min"] == 10
+    assert limits["strategy_max"] == 95
+
+
+async def test_device_coordinator_aggregates_use_meter_statistics(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """Grid export aggregates follow the fresher statistics values."""
+    api_client = AsyncMock()
+    api_client.fetch_device_list.return_value = [
+        {
+            "deviceId": "meter_001",
+            "deviceType": "SHELLY_3EM_METER",
+            "status": "Online",
+            "dailyRetEnergy": 10.5,
+            "totalRetEnergy": 1234.5,
+        },
+    ]
+    api_client.fetch_device_statistics.return_value = {
+        "dailyRetEnergy": 11.25,
+        "totalRetEnergy": 1235.25,
+    }
+
+    coordinator = SunlitDeviceCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+    )
+
+    data = await coordinator._async_update_data()
+
+    assert data["aggregates"]["daily_grid_export_energy"] == 11.25
+    assert data["aggregates"]["total_grid_export_energy"] == 1235.25
+
+
+async def test_device_coordinator_keeps_devices_identity_stable(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """An unchanged device list refreshes the stored devices in place."""
+    api_client = AsyncMock()
+    api_client.invalidate_device = MagicMock()
+    api_client.fetch_device_list.return_value = [
+        {"deviceId": 55478, "deviceType": "SHELLY_3EM_METER", "status": "Offline"},
+    ]
+
+    coordinator = SunlitDeviceCoordinator(hass, api_client, "34038", "Test Family")
+    await coordinator._async_update_data()
+    devices = coordinator.devices
+    meter = devices["55478"]
+
+    # Same membership, new payload: the entries are updated in place
+    api_client.fetch_device_list.return_value = [
+        {"deviceId": 55478, "deviceType": "SHELLY_3EM_METER", "status": "Online"},
+    ]
+    await coordinator._async_update_data()
+    assert coordinator.devices is devices
+    assert coordinator.devices["55478"] is meter
+    assert meter["status"] == "Online"
+    # Coming back online drops the cached details (e.g. after a firmware update)
+    api_client.invalidate_device.assert_called_once_with("55478")
+
+    # A new device rebuilds the map
+    api_client.fetch_device_list.return_value = [
+        {"deviceId": 55478, "deviceType": "SHELLY_3EM_METER", "status": "Online"},
+        {
+            "deviceId": 41714,
+            "deviceType": "ENERGY_STORAGE_BATTERY",
+            "status": "Offline",
+        },
+    ]
+    await coordinator._async_update_data()
+    assert coordinator.devices is not devices
+    assert set(coordinator.devices) == {"55478", "41714"}
@@ -7,7 +7,7 @@ from custom_components.sunlit.const import (
     DEVICE_TYPE_METER,
     DEVICE_TYPE_METER_PRO,
 )
-from custom_components.sunlit.entities.base import normalize_device_type
+from custom_components.sunlit.entities.base import family_slug, normalize_device_type
 
 
 def test_normalize_shelly_3em_meter():
@@ -63,3 +63,9 @@ def test_normalize_preserves_inverter_unique_id_stability():
     inverter_yuneng = normalize_device_type(DEVICE_TYPE_INVERTER)
     inverter_solar = normalize_device_type(DEVICE_TYPE_INVERTER_SOLAR)
     assert inverter_yuneng == inverter_solar == "inverter"
+
+
+def test_family_slug_matches_unique_id_format():
+    """Family names are lowercased with spaces replaced for unique_ids."""
+    assert family_slug("Test Family") == "test_family"
+    assert family_slug("Garage") == "garage"
@@ -1,6 +1,6 @@
 """Test the Sunlit family coordinator."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
@@ -400,3 +400,96 @@ async def test_charging_box_strategy_null_booleans_normalized_to_false(
         assert family_data[key] is False, (
             f"{key} should be False, got {family_data[key]!r}"
         )
+
+
+async def test_family_settings_refreshed_on_slow_cadence(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """SOC limits and charging box strategy are re-fetched every 5 minutes."""
+    api_client = AsyncMock()
+    api_client.fetch_space_soc.return_value = {"strategySocMin": 10}
+    api_client.get_charging_box_strategy.return_value = {"storageStrategy": "Auto"}
+
+    coordinator = SunlitFamilyCoordinator(hass, api_client, "34038", "Test Family")
+
+    with patch(
+        "custom_components.sunlit.coordinators.family.time.monotonic"
+    ) as monotonic:
+        monotonic.return_value = 1000.0
+        await coordinator._async_update_data()
+
+        # Within the interval the cached values are merged in
+        monotonic.return_value = 1030.0
+        data = await coordinator._async_update_data()
+        assert data["family"]["strategy_soc_min"] == 10
+        assert data["family"]["storage_strategy"] == "Auto"
+        assert api_client.fetch_space_soc.call_count == 1
+        assert api_client.get_charging_box_strategy.call_count == 1
+
+        monotonic.return_value = 1300.0
+        await coordinator._async_update_data()
+        assert api_client.fetch_space_soc.call_count == 2
+        assert api_client.get_charging_box_strategy.call_count == 2
+
+
+async def test_family_settings_invalidated_after_write(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """invalidate_settings forces the next refresh to re-fetch the settings."""
+    api_client = AsyncMock()
+    api_client.fetch_space_soc.return_value = {"strategySocMin": 10}
+    api_client.get_charging_box_strategy.return_value = {"storageStrategy": "Auto"}
+
+    coordinator = SunlitFamilyCoordinator(hass, api_client, "34038", "Test Family")
+
+    with patch(
+        "custom_components.sunlit.coordinators.family.time.monotonic"
+    ) as monotonic:
+        monotonic.return_value = 1000.0
+        await coordinator._async_update_data()
+
+        api_client.fetch_space_soc.return_value = {"strategySocMin": 20}
+        coordinator.invalidate_settings()
+        monotonic.return_value = 1030.0
+        data = await coordinator._async_update_data()
+
+    assert api_client.fetch_space_soc.call_count == 2
+    assert data["family"]["strategy_soc_min"] == 20
+
+
+async def test_family_settings_keep_values_when_one_fetch_fails(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """A failed settings call keeps its old values and is retried next poll."""
+    api_client = AsyncMock()
+    api_client.fetch_space_soc.return_value = {"strategySocMin": 10}
+    api_client.get_charging_box_strategy.return_value = {"storageStrategy": "Auto"}
+
+    coordinator = SunlitFamilyCoordinator(hass, api_client, "34038", "Test Family")
+
+    with patch(
+        "custom_components.sunlit.coordinators.family.time.monotonic"
+    ) as monotonic:
+        monotonic.return_value = 1000.0
+        await coordinator._async_update_data()
+
+        # Stale interval: SOC limits fail, the charging box call succeeds
+        api_client.fetch_space_soc.side_effect = Exception("API Error")
+        api_client.get_charging_box_strategy.return_value = {
+            "storageStrategy": "Manual"
+        }
+        monotonic.return_value = 1300.0
+        data = await coordinator._async_update_data()
+        assert data["family"]["strategy_soc_min"] == 10
+        assert data["family"]["storage_strategy"] == "Manual"
+
+        # Not marked fresh, so the next poll retries both calls
+        api_client.fetch_space_soc.side_effect = None
+        api_client.fetch_space_soc.return_value = {"strategySocMin": 20}
+        monotonic.return_value = 1330.0
+        data = await coordinator._async_update_data()
+        assert data["family"]["strategy_soc_min"] == 20
+        assert api_client.fetch_space_soc.call_count == 3
@@ -56,7 +56,7 @@ async def test_mppt_coordinator_energy_calculation(
     import time
     # Set the last update time to 1 hour ago
     key = "battery_001_batteryMppt1Energy"
-    current_time = time.time()
+    current_time = time.monotonic()
     coordinator.last_mppt_update[key] = current_time - 3600  # 1 hour ago
     coordinator.last_mppt_power[key] = 500
 
@@ -222,8 +222,8 @@ async def test_mppt_coordinator_trapezoidal_integration(
 
     # Override time calculation for test
     import time
-    original_time = time.time
-    time.time = lambda: 3600  # 1 hour later
+    original_time = time.monotonic
+    time.monotonic = lambda: 3600  # 1 hour later
 
     try:
         data = await coordinator._async_update_data()
@@ -234,4 +234,76 @@ async def test_mppt_coordinator_trapezoidal_integration(
         assert abs(battery_mppt["batteryMppt1Energy"] - 1.5) < 0.01  # Allow small floating point error
 
     finally:
-        time.time = original_time
+        time.monotonic = original_time
+
+
+async def test_mppt_coordinator_total_tracks_accumulators(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """The running total starts from the stored accumulators and adds increments."""
+    device_coordinator = MagicMock()
+    device_coordinator.data = {
+        "devices": {
+            "battery_001": {
+                "deviceType": "ENERGY_STORAGE_BATTERY",
+                "batteryMppt1InPower": 1000,
+            }
+        }
+    }
+    device_coordinator.get_battery_module_count.return_value = 0
+
+    coordinator = SunlitMpptEnergyCoordinator(
+        hass,
+        device_coordinator,
+        "34038",
+        "Test Family",
+    )
+    coordinator._restored = True
+    coordinator.mppt_energy = {
+        "battery_001_batteryMppt1Energy": 1.25,
+        "battery_002_batteryMppt1Energy": 2.0,
+    }
+
+    data = await coordinator._async_update_data()
+    assert data["total_mppt_energy"] == 3.25
+
+    # One hour at a steady 1000 W adds 1 kWh to the total
+    key = "battery_001_batteryMppt1Energy"
+    coordinator.last_mppt_update[key] -= 3600
+    data = await coordinator._async_update_data()
+    assert abs(data["total_mppt_energy"] - 4.25) < 0.01
+
+
+async def test_mppt_coordinator_caches_module_count_per_refresh(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """The module count is looked up once per device coordinator refresh."""
+    device_coordinator = MagicMock()
+    device_coordinator.data = {
+        "devices": {
+            "battery_001": {
+                "deviceType": "ENERGY_STORAGE_BATTERY",
+                "battery1Mppt1InPower": 200,
+            }
+        }
+    }
+    device_coordinator.data_version = 1
+    device_coordinator.get_battery_module_count.return_value = 1
+
+    coordinator = SunlitMpptEnergyCoordinator(
+        hass,
+        device_coordinator,
+        "34038",
+        "Test Family",
+    )
+
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    assert device_coordinator.get_battery_module_count.call_count == 1
+
+    # A new device refresh invalidates the cached count
+    device_coordinator.data_version = 2
+    await coordinator._async_update_data()
+    assert device_coordinator.get_battery_module_count.call_count == 2
@@ -30,11 +30,11 @@ def test_real_battery_stats_expose_expected_mppt_fields():
     """
     stats = load_api_fixture(BATTERY_STATS)
 
-    # Head-unit MPPTs consumed by _calculate_main_mppt_energy.
+    # Head-unit MPPTs integrated by the MPPT coordinator.
     for key in ("batteryMppt1InPower", "batteryMppt2InPower"):
         assert key in stats, f"missing {key}"
 
-    # Module MPPTs consumed by _calculate_module_mppt_energy.
+    # Extension-module MPPTs integrated by the MPPT coordinator.
     for key in ("battery1Mppt1InPower", "battery2Mppt1InPower"):
         assert key in stats, f"missing {key}"
         assert stats[key] is not None and stats[key] > 0
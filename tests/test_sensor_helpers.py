@@ -14,6 +14,7 @@ from homeassistant.const import (
 import pytest
 
 from custom_components.sunlit.entities.helpers import (
+    build_sensor_description,
     get_device_class_for_sensor,
     get_entity_category,
     get_icon_for_sensor,
@@ -624,3 +625,23 @@ class TestDeviceDiagnosticSensors:
             get_icon_for_sensor("system_status", "ENERGY_STORAGE_BATTERY")
             == "mdi:information-outline"
         )
+
+
+class TestBuildSensorDescription:
+    """Test the combined sensor description builder."""
+
+    def test_description_carries_derived_metadata(self):
+        """All classification helpers feed into one description."""
+        description = build_sensor_description("daily_earnings", "Daily Earnings")
+        assert description.key == "daily_earnings"
+        assert description.name == "Daily Earnings"
+        assert description.device_class == SensorDeviceClass.MONETARY
+        assert description.state_class == SensorStateClass.TOTAL
+        assert description.native_unit_of_measurement == "EUR"
+        assert description.suggested_display_precision == 2
+
+    def test_description_is_shared_per_key_and_name(self):
+        """Repeat builds for the same key and name reuse one description."""
+        first = build_sensor_description("batterySoc", "Battery SOC")
+        assert build_sensor_description("batterySoc", "Battery SOC") is first
+        assert build_sensor_description("batterySoc", "SOC") is not first
@@ -1509,3 +1509,121 @@ async def test_device_type_sensor_mapping(
     assert isinstance(unknown_sensor, SunlitUnknownDeviceSensor), (
         f"Expected SunlitUnknownDeviceSensor, got {type(unknown_sensor)}"
     )
+
+
+def test_battery_module_sensor_native_value():
+    """Module MPPT readings of 0 are unavailable while the module reports SOC."""
+    from homeassistant.components.sensor import SensorEntityDescription
+
+    from custom_components.sunlit.const import DEVICE_TYPE_BATTERY
+    from custom_components.sunlit.entities.battery_module_sensor import (
+        SunlitBatteryModuleSensor,
+    )
+
+    coordinator = MagicMock(spec=SunlitDeviceCoordinator)
+    coordinator.data = {
+        "devices": {
+            "41714": {
+                "battery1Soc": 80,
+                "battery1Mppt1InPower": 0,
+                "battery2Mppt1InPower": 0,
+            }
+        }
+    }
+
+    def module_sensor(key: str, module_number: int) -> SunlitBatteryModuleSensor:
+        return SunlitBatteryModuleSensor(
+            coordinator=coordinator,
+            description=SensorEntityDescription(key=key, name=key),
+            entry_id="entry",
+            family_id="34038",
+            family_name="Garage",
+            device_id="41714",
+            device_info_data={"deviceType": DEVICE_TYPE_BATTERY, "deviceSn": "SN1"},
+            module_number=module_number,
+        )
+
+    assert module_sensor("battery1Soc", 1).native_value == 80
+    assert module_sensor("battery1Mppt1InPower", 1).native_value is None
+    # Without SOC the module reading is passed through as-is
+    assert module_sensor("battery2Mppt1InPower", 2).native_value == 0
+    assert module_sensor("battery1_capacity", 1).native_value == 2.15
+
+    coordinator.data = None
+    assert module_sensor("battery1Soc", 1).native_value is None
+
+
+def test_device_sensor_skips_unchanged_state_writes():
+    """Coordinator updates only write state when the entity's output changed."""
+    from homeassistant.components.sensor import SensorEntityDescription
+
+    from custom_components.sunlit.const import DEVICE_TYPE_METER
+    from custom_components.sunlit.entities.meter_sensor import SunlitMeterSensor
+
+    coordinator = MagicMock(spec=SunlitDeviceCoordinator)
+    coordinator.last_update_success = True
+    coordinator.data = {"devices": {"55478": {"total_ac_power": 120}}}
+
+    sensor = SunlitMeterSensor(
+        coordinator=coordinator,
+        description=SensorEntityDescription(key="total_ac_power", name="Power"),
+        entry_id="entry",
+        family_id="34038",
+        family_name="Garage",
+        device_id="55478",
+        device_info_data={"deviceType": DEVICE_TYPE_METER, "deviceSn": "SN2"},
+    )
+
+    with patch.object(sensor, "async_write_ha_state") as write_state:
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 1
+
+        coordinator.data = {"devices": {"55478": {"total_ac_power": 130}}}
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 2
+
+        # Attribute-only changes are still written
+        coordinator.data = {
+            "devices": {"55478": {"total_ac_power": 130, "fault": True}}
+        }
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 3
+
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 4
+
+
+def test_family_sensor_writes_state_when_last_reset_changes():
+    """A new last_reset at local midnight is written even if the value holds."""
+    from custom_components.sunlit.entities.family_sensor import SunlitFamilySensor
+    from custom_components.sunlit.entities.helpers import build_sensor_description
+
+    coordinator = MagicMock(spec=SunlitFamilyCoordinator)
+    coordinator.last_update_success = True
+    coordinator.data = {"family": {"daily_earnings": 0.0}}
+
+    sensor = SunlitFamilySensor(
+        coordinator,
+        build_sensor_description("daily_earnings", "Daily Earnings"),
+        "entry",
+        "34038",
+        "Garage",
+    )
+
+    midnight = datetime(2026, 10, 15)
+    with (
+        patch.object(sensor, "async_write_ha_state") as write_state,
+        patch(
+            "custom_components.sunlit.entities.family_sensor.dt_util.start_of_local_day",
+            return_value=midnight,
+        ) as start_of_day,
+    ):
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 1
+
+        start_of_day.return_value = midnight + timedelta(days=1)
+        sensor._handle_coordinator_update()
+        assert write_state.call_count == 2
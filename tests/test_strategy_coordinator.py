@@ -49,11 +49,121 @@ async def test_strategy_coordinator_update_success(
     # Check history is stored
     assert "strategy_history" in strategy_data
     assert len(strategy_data["strategy_history"]) == 2
+    formatted = strategy_data["strategy_history_formatted"]
+    assert [entry["strategy"] for entry in formatted] == [
+        "SELF_CONSUMPTION",
+        "GRID_FEED",
+    ]
+    assert (
+        formatted[0]["timestamp"]
+        == datetime.fromtimestamp(
+            strategy_history_response["content"]["content"][0]["modifyDate"] / 1000
+        ).isoformat()
+    )
 
     # Verify API call
     api_client.fetch_space_strategy_history.assert_called_once_with("34038")
 
 
+async def test_strategy_coordinator_counts_only_last_day(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """Older entries in the newest-first history don't count as changes today."""
+    now = datetime.now()
+    api_client = AsyncMock()
+    api_client.fetch_space_strategy_history.return_value = {
+        "content": [
+            {
+                "modifyDate": int((now - timedelta(hours=hours)).timestamp() * 1000),
+                "strategy": "SELF_CONSUMPTION",
+                "status": "ACTIVE",
+            }
+            for hours in (1, 5, 23, 25, 48)
+        ]
+    }
+
+    coordinator = SunlitStrategyHistoryCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+    )
+
+    data = await coordinator._async_update_data()
+
+    assert data["strategy"]["strategy_changes_today"] == 3
+    assert len(data["strategy"]["strategy_history"]) == 5
+
+
+async def test_strategy_coordinator_skips_entries_without_timestamp(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+):
+    """An entry without modifyDate doesn't end the changes-today count."""
+    now = datetime.now()
+
+    def entry(modify_date):
+        return {"modifyDate": modify_date, "strategy": "SELF_CONSUMPTION"}
+
+    api_client = AsyncMock()
+    api_client.fetch_space_strategy_history.return_value = {
+        "content": [
+            entry(int((now - timedelta(hours=1)).timestamp() * 1000)),
+            entry(None),
+            {"strategy": "SELF_CONSUMPTION"},
+            entry(int((now - timedelta(hours=5)).timestamp() * 1000)),
+            entry(int((now - timedelta(hours=30)).timestamp() * 1000)),
+        ]
+    }
+
+    coordinator = SunlitStrategyHistoryCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+    )
+
+    data = await coordinator._async_update_data()
+
+    assert data["strategy"]["strategy_changes_today"] == 2
+
+
+async def test_strategy_coordinator_unchanged_history_compares_equal(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+    strategy_history_response,
+):
+    """An unchanged history yields equal data, so always_update=False skips it."""
+    api_client = AsyncMock()
+    api_client.fetch_space_strategy_history.return_value = strategy_history_response[
+        "content"
+    ]
+
+    coordinator = SunlitStrategyHistoryCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+    )
+
+    coordinator.data = await coordinator._async_update_data()
+    assert await coordinator._async_update_data() == coordinator.data
+
+    # A new latest entry produces fresh data
+    content = strategy_history_response["content"]
+    newest = dict(
+        content["content"][0], modifyDate=int(datetime.now().timestamp() * 1000)
+    )
+    api_client.fetch_space_strategy_history.return_value = {
+        **content,
+        "content": [newest, *content["content"]],
+    }
+    data = await coordinator._async_update_data()
+    assert data != coordinator.data
+    assert data["strategy"]["strategy_changes_today"] == 3
+
+
 async def test_strategy_coordinator_no_history(
     hass: HomeAssistant,
     enable_custom_integrations,
@@ -87,9 +197,7 @@ async def test_strategy_coordinator_api_failure(
 ):
     """Test strategy coordinator handles SunlitApiError gracefully."""
     api_client = AsyncMock()
-    api_client.fetch_space_strategy_history.side_effect = SunlitApiError(
-        "API failed"
-    )
+    api_client.fetch_space_strategy_history.side_effect = SunlitApiError("API failed")
 
     coordinator = SunlitStrategyHistoryCoordinator(
         hass,
@@ -162,3 +270,51 @@ async def test_strategy_coordinator_update_interval(
 
     # Should have 5 minute update interval
     assert coordinator.update_interval == timedelta(minutes=5)
+
+
+async def test_strategy_coordinator_refreshes_when_older_entry_changes(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+    strategy_history_response,
+):
+    """Edits to older history entries produce different coordinator data."""
+    content = strategy_history_response["content"]
+    stale = {
+        "modifyDate": int((datetime.now() - timedelta(days=2)).timestamp() * 1000),
+        "strategy": "GRID_FEED",
+        "status": "COMPLETED",
+    }
+    entries = [*content["content"], stale]
+    api_client = AsyncMock()
+    api_client.fetch_space_strategy_history.return_value = {
+        **content,
+        "content": entries,
+    }
+
+    coordinator = SunlitStrategyHistoryCoordinator(
+        hass,
+        api_client,
+        "34038",
+        "Test Family",
+    )
+    coordinator.data = await coordinator._async_update_data()
+
+    # Same newest entry and count, but an older entry was edited
+    edited = [entries[0], dict(entries[1], strategy="EDITED"), stale]
+    api_client.fetch_space_strategy_history.return_value = {
+        **content,
+        "content": edited,
+    }
+    data = await coordinator._async_update_data()
+    assert data != coordinator.data
+    assert data["strategy"]["strategy_history"][1]["strategy"] == "EDITED"
+    coordinator.data = data
+
+    # Dropping the entry outside the 24h window refreshes the history too
+    api_client.fetch_space_strategy_history.return_value = {
+        **content,
+        "content": edited[:2],
+    }
+    data = await coordinator._async_update_data()
+    assert data != coordinator.data
+    assert len(data["strategy"]["strategy_history"]) == 2
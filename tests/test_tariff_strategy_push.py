@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
@@ -102,6 +102,29 @@ async def test_async_push_sends_full_low_and_high_blocks(
     assert {"strategy", "socMin", "socMax"}.issubset(high.keys())
 
 
+async def test_async_push_refreshes_family_settings(
+    hass: HomeAssistant, enable_custom_integrations
+):
+    """A push makes the family coordinator re-fetch its cached SOC limits."""
+    api = AsyncMock()
+    api.set_tariff_strategy.return_value = _load("tariff_strategy_add_accepted.json")
+    family_coord = MagicMock()
+    family_coord.async_request_refresh = AsyncMock()
+    coord = SunlitStrategyHistoryCoordinator(
+        hass=hass,
+        api_client=api,
+        family_id="34038",
+        family_name="Test Family",
+        family_coordinator=family_coord,
+    )
+    coord.async_request_refresh = AsyncMock()
+
+    await coord.async_push_tariff_setup()
+
+    family_coord.invalidate_settings.assert_called_once()
+    family_coord.async_request_refresh.assert_awaited_once()
+
+
 async def test_tariff_setup_property_returns_defensive_copy(
     hass: HomeAssistant, enable_custom_integrations
 ):
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.core import HomeAssistant
@@ -194,3 +194,27 @@ async def test_readback_skips_none_fields(
     assert coord.tariff_setup["low"]["socMax"] == 90
     assert coord.tariff_setup["high"]["socMin"] == 15
     assert coord.tariff_setup["high"]["socMax"] == 100
+
+
+async def test_readback_change_notifies_listeners(
+    hass: HomeAssistant, enable_custom_integrations
+):
+    """A reconciled setup reaches the entities even if the history is unchanged.
+
+    The coordinator skips listeners for equal data, and the tariff setup is
+    not part of that data, so a cloud-side edit must notify them directly.
+    """
+    api = _api_with_tariff_active()
+    coord = _make_coordinator(hass, api)
+    coord.data = {"strategy": {}}
+    listener = MagicMock()
+    unsub = coord.async_add_listener(listener)
+
+    coord.update_tariff_setup_field("low", "socMin", 50)
+    await coord._async_update_data()
+    assert listener.call_count == 1
+
+    # Nothing changed on the second readback
+    await coord._async_update_data()
+    assert listener.call_count == 1
+    unsub()